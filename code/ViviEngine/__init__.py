@@ -1,5 +1,7 @@
 from .entity import Entity
+from .components import ArrayEntity
 from .game import Game
 from .scene import Scene
+from .tilemap import Tilemap
 from .variables import *
 from .utils import *
@@ -0,0 +1,124 @@
+import json
+import mmap
+import struct
+import pygame
+from typing import Any, Dict, List, Tuple
+
+# En-tête : signature, version, taille de l'index JSON
+_MAGIC = b'VIVIARC'
+_VERSION = 3
+_HEADER = struct.Struct('<7sBI')
+
+# Alignement des pixels de chaque sprite dans le fichier
+_ALIGN = 16
+
+# Ordre des octets des pixels (correspond au format 32 bits habituel de l'écran : les
+# surfaces avec alpha par pixel n'ont pas besoin d'être converties au chargement)
+PIXEL_FORMAT = 'BGRA'
+
+def write_archive(path: str, entries: List[Tuple[str, pygame.Surface, Dict[str, Any]]]) -> int:
+    """
+    Écrit une archive contenant les pixels bruts (déjà décodés) de plusieurs sprites.
+
+    Args:
+        path: Chemin du fichier à écrire
+        entries: Liste de (nom, surface, disposition de la planche : images, grille, centres, durées).
+                 La classe de transparence de chaque surface (opaque, couleur transparente
+                 ou alpha par pixel) est enregistrée pour être restaurée au chargement
+
+    Returns:
+        Taille du fichier écrit en octets
+    """
+    index: List[Dict[str, Any]] = []
+    blobs: List[bytes] = []
+    offset = 0
+    for name, surface, sheet in entries:
+        # tobytes ignore la couleur transparente : elle est enregistrée à part
+        # (les pixels transparents gardent cette couleur)
+        colorkey = surface.get_colorkey()
+        if colorkey is not None:
+            alpha = 'binary'
+            colorkey = list(colorkey[:3])
+        elif surface.get_flags() & pygame.SRCALPHA:
+            alpha = 'soft'
+        else:
+            alpha = 'opaque'
+        data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        index.append({
+            'name': name,
+            'offset': offset,
+            'size': len(data),
+            'width': surface.get_width(),
+            'height': surface.get_height(),
+            'alpha': alpha,
+            'colorkey': colorkey,
+            'sheet': sheet,
+        })
+        padding = -len(data) % _ALIGN
+        blobs.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    header = json.dumps({'format': PIXEL_FORMAT, 'sprites': index}).encode('utf-8')
+    header += b' ' * (-(_HEADER.size + len(header)) % _ALIGN)
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(header)))
+        file.write(header)
+        for blob in blobs:
+            file.write(blob)
+        return file.tell()
+
+class AssetArchive:
+    """
+    Archive de sprites ouverte en mémoire (mmap).
+    Les surfaces avec alpha par pixel utilisent directement les pages du fichier : rien n'est
+    décodé ni copié au chargement, les pixels sont lus par le système à la demande.
+    Les surfaces opaques ou à couleur transparente sont copiées au format d'affichage
+    (sans alpha, couleur transparente accélérée), plus rapide à dessiner.
+    """
+
+    def __init__(self, path: str):
+        """
+        Ouvre une archive écrite par write_archive().
+
+        Args:
+            path: Chemin de l'archive
+
+        Raises:
+            ValueError: Si le fichier n'est pas une archive valide
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            # Mappage privé : les surfaces restent modifiables sans toucher au fichier
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, header_size = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"'{path}' n'est pas une archive ViviEngine (version {_VERSION})")
+        header = json.loads(bytes(self._map[_HEADER.size:_HEADER.size + header_size]))
+
+        self.format: str = header['format']
+        self.entries: Dict[str, Dict[str, Any]] = {entry['name']: entry for entry in header['sprites']}
+        self._data_start = _HEADER.size + header_size
+        self._view = memoryview(self._map)
+
+    def get_surface(self, name: str) -> pygame.Surface:
+        """
+        Retourne la surface d'un sprite, adossée au fichier mappé (sans copie) si elle a
+        un alpha par pixel ou si aucune fenêtre n'est ouverte, convertie au format d'affichage sinon.
+
+        Args:
+            name: Nom du sprite
+
+        Returns:
+            Surface contenant toutes les images du sprite
+        """
+        entry = self.entries[name]
+        start = self._data_start + entry['offset']
+        surface = pygame.image.frombuffer(self._view[start:start + entry['size']],
+                                          (entry['width'], entry['height']), self.format)
+        if entry['alpha'] == 'soft' or not pygame.display.get_surface():
+            return surface
+        surface = surface.convert()
+        if entry['alpha'] == 'binary':
+            surface.set_colorkey(entry['colorkey'], pygame.RLEACCEL)
+        return surface
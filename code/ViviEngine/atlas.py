@@ -0,0 +1,101 @@
+import pygame
+from typing import Any, Dict, List, Optional, Tuple
+
+class TextureAtlas:
+    """
+    Regroupe plusieurs surfaces dans quelques grandes pages (rangement par étagères).
+    Chaque surface ajoutée est ensuite accessible sous forme de sous-surface d'une page, sans copie.
+    """
+
+    def __init__(self, page_size: int = 2048, padding: int = 0):
+        """
+        Initialise un atlas vide.
+
+        Args:
+            page_size: Largeur et hauteur maximale d'une page en pixels
+            padding: Espace laissé entre deux surfaces
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: List[pygame.Surface] = []
+        self._used_area = 0
+
+    def pack(self, surfaces: List[pygame.Surface]) -> List[Optional[Tuple[int, pygame.Rect]]]:
+        """
+        Range les surfaces dans les pages et y copie leurs pixels.
+
+        Args:
+            surfaces: Surfaces à ranger
+
+        Returns:
+            Pour chaque surface, (index de page, rectangle dans la page),
+            ou None si elle est trop grande pour une page
+        """
+        placements: List[Optional[Tuple[int, pygame.Rect]]] = [None] * len(surfaces)
+        page_sizes: List[List[int]] = []
+
+        # Les plus hautes d'abord pour des étagères bien remplies
+        order = sorted(range(len(surfaces)), key=lambda i: surfaces[i].get_height(), reverse=True)
+
+        page = -1
+        shelf_x = shelf_y = shelf_height = 0
+        for i in order:
+            width, height = surfaces[i].get_size()
+            if width > self.page_size or height > self.page_size:
+                continue
+
+            # Nouvelle étagère si la ligne courante est pleine
+            if page < 0 or shelf_x + width > self.page_size:
+                shelf_y += shelf_height
+                shelf_x = shelf_height = 0
+            # Nouvelle page si la page courante est pleine
+            if page < 0 or shelf_y + height > self.page_size:
+                page += 1
+                page_sizes.append([0, 0])
+                shelf_x = shelf_y = shelf_height = 0
+
+            placements[i] = (page, pygame.Rect(shelf_x, shelf_y, width, height))
+            shelf_x += width + self.padding
+            shelf_height = max(shelf_height, height + self.padding)
+            page_sizes[page][0] = max(page_sizes[page][0], shelf_x - self.padding)
+            page_sizes[page][1] = max(page_sizes[page][1], shelf_y + height)
+            self._used_area += width * height
+
+        # Créer les pages (réduites à la zone utilisée) et copier les pixels
+        base = len(self.pages)
+        for size in page_sizes:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface():
+                surface = surface.convert_alpha()
+            self.pages.append(surface)
+        for i, placement in enumerate(placements):
+            if placement is not None:
+                page_index, rect = placement
+                placements[i] = (base + page_index, rect)
+                # Copier l'alpha tel quel (les surfaces sans alpha par pixel sont copiées normalement)
+                flags = pygame.BLEND_RGBA_MAX if surfaces[i].get_flags() & pygame.SRCALPHA else 0
+                self.pages[base + page_index].blit(surfaces[i], rect.topleft, special_flags=flags)
+        return placements
+
+    def get_region(self, page: int, rect: pygame.Rect) -> pygame.Surface:
+        """Retourne une sous-surface (sans copie) d'une page."""
+        return self.pages[page].subsurface(rect)
+
+    def get_bytes(self) -> int:
+        """Retourne la mémoire occupée par les pages en octets."""
+        return sum(page.get_pitch() * page.get_height() for page in self.pages)
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Retourne l'occupation de l'atlas.
+
+        Returns:
+            Dictionnaire (pages, page_sizes, bytes, occupancy)
+        """
+        total_area = sum(page.get_width() * page.get_height() for page in self.pages)
+        return {
+            'pages': len(self.pages),
+            'page_sizes': [page.get_size() for page in self.pages],
+            'bytes': self.get_bytes(),
+            'occupancy': self._used_area / total_area if total_area else 0.0,
+        }
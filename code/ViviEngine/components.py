@@ -0,0 +1,213 @@
+from typing import Dict, List, Optional, Tuple
+from .entity import Entity, _NO_MASK
+
+try:
+    import numpy
+except ImportError:  # NumPy est optionnel : seul ArrayEntity en a besoin
+    numpy = None
+
+# Colonnes stockées dans des tableaux : nom -> (type NumPy, valeur par défaut)
+_FLOAT_COLUMNS = ('x', 'y', 'xprevious', 'yprevious', 'hspeed', 'vspeed',
+                  'image_index', 'image_speed', 'image_xscale', 'image_yscale')
+_COLUMN_DEFAULTS = {
+    'x': 0.0, 'y': 0.0, 'xprevious': 0.0, 'yprevious': 0.0, 'hspeed': 0.0, 'vspeed': 0.0,
+    'image_index': 0.0, 'image_speed': 0.0, 'image_xscale': 1.0, 'image_yscale': 1.0,
+    'image_number': 1, 'active': True, '_mask': _NO_MASK,
+}
+
+class ComponentStorage:
+    """
+    Stockage en colonnes (un tableau NumPy par attribut) des ArrayEntity d'une scène.
+    Le mouvement et l'animation de toutes les entités sont calculés en une seule passe vectorisée.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialise un stockage vide.
+
+        Args:
+            capacity: Nombre d'entités avant le premier agrandissement des tableaux
+        """
+        if numpy is None:
+            raise ImportError("ArrayEntity nécessite NumPy (pip install ViviEngine[numpy])")
+        self.count = 0
+        self.entities: List['ArrayEntity'] = []  # Emplacement -> entité
+        self.columns: Dict[str, 'numpy.ndarray'] = {}
+        self._allocate(capacity)
+
+    def add(self, entity: 'ArrayEntity'):
+        """Range une entité dans les tableaux (ses valeurs actuelles y sont copiées)."""
+        if self.count == len(self.columns['x']):
+            self._allocate(self.count * 2)
+        slot = self.count
+        self.count += 1
+        self.entities.append(entity)
+
+        values = entity._pending
+        for name, column in self.columns.items():
+            column[slot] = values[name]
+        entity._pending = None
+        entity._storage = self
+        entity._slot = slot
+
+    def remove(self, entity: 'ArrayEntity'):
+        """Retire une entité : la dernière entité prend sa place (les tableaux restent contigus)."""
+        slot = entity._slot
+        entity._pending = self._read_values(slot)
+        entity._storage = None
+
+        last = self.count - 1
+        if slot != last:
+            for column in self.columns.values():
+                column[slot] = column[last]
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            moved._slot = slot
+        self.entities.pop()
+        self.count = last
+
+    def clear(self):
+        """Retire toutes les entités."""
+        for entity in self.entities[:]:
+            self.remove(entity)
+
+    def step(self):
+        """Système de mouvement et d'animation, appliqué à toutes les entités actives à la fois."""
+        n = self.count
+        if n == 0:
+            return
+        c = self.columns
+        active = c['active'][:n]
+        x, y = c['x'][:n], c['y'][:n]
+
+        # Position précédente puis déplacement
+        numpy.copyto(c['xprevious'][:n], x, where=active)
+        numpy.copyto(c['yprevious'][:n], y, where=active)
+        numpy.add(x, c['hspeed'][:n], out=x, where=active)
+        numpy.add(y, c['vspeed'][:n], out=y, where=active)
+
+        # Animation en boucle (même règle que Entity._update_animation)
+        index, speed, number = c['image_index'][:n], c['image_speed'][:n], c['image_number'][:n]
+        animated = active & (speed > 0) & (number > 1)
+        numpy.add(index, speed, out=index, where=animated)
+        numpy.fmod(index, number, out=index, where=animated & (index >= number))
+
+    def get_bboxes(self) -> Tuple['numpy.ndarray', 'numpy.ndarray', 'numpy.ndarray', 'numpy.ndarray']:
+        """
+        Calcule les boîtes de collision de toutes les entités (même règle que Entity._get_bbox).
+
+        Returns:
+            Tableaux (gauche, haut, droite, bas), indexés par emplacement
+        """
+        n = self.count
+        c = self.columns
+        mask = c['_mask'][:n]
+        xscale, yscale = c['image_xscale'][:n], c['image_yscale'][:n]
+        x1 = c['x'][:n] + mask[:, 0] * xscale
+        x2 = c['x'][:n] + mask[:, 1] * xscale
+        y1 = c['y'][:n] + mask[:, 2] * yscale
+        y2 = c['y'][:n] + mask[:, 3] * yscale
+        return numpy.minimum(x1, x2), numpy.minimum(y1, y2), numpy.maximum(x1, x2), numpy.maximum(y1, y2)
+
+    def query_region(self, left: float, top: float, right: float, bottom: float) -> List['ArrayEntity']:
+        """Retourne les entités dont la boîte de collision touche une zone."""
+        box_left, box_top, box_right, box_bottom = self.get_bboxes()
+        hits = numpy.flatnonzero((box_right >= left) & (box_left <= right) &
+                                 (box_bottom >= top) & (box_top <= bottom))
+        entities = self.entities
+        return [entities[slot] for slot in hits]
+
+    def _allocate(self, capacity: int):
+        """Crée ou agrandit les tableaux en conservant leur contenu."""
+        capacity = max(capacity, 1)
+        shapes = {name: (numpy.float64, (capacity,)) for name in _FLOAT_COLUMNS}
+        shapes['image_number'] = (numpy.int64, (capacity,))
+        shapes['active'] = (numpy.bool_, (capacity,))
+        shapes['_mask'] = (numpy.float64, (capacity, 4))
+        for name, (dtype, shape) in shapes.items():
+            column = numpy.zeros(shape, dtype)
+            if name in self.columns:
+                column[:self.count] = self.columns[name][:self.count]
+            self.columns[name] = column
+
+    def _read_values(self, slot: int) -> Dict[str, object]:
+        """Copie les valeurs d'un emplacement dans des objets Python."""
+        values = {name: column[slot].item() for name, column in self.columns.items() if name != '_mask'}
+        values['_mask'] = tuple(self.columns['_mask'][slot].tolist())
+        return values
+
+def _column_property(name: str, doc: str) -> property:
+    """Crée une propriété qui lit et écrit la colonne d'une ArrayEntity."""
+    def getter(self):
+        storage = self._storage
+        if storage is None:
+            return self._pending[name]
+        return storage.columns[name][self._slot].item()
+
+    def setter(self, value):
+        storage = self._storage
+        if storage is None:
+            self._pending[name] = value
+        else:
+            storage.columns[name][self._slot] = value
+
+    return property(getter, setter, doc=doc)
+
+class ArrayEntity(Entity):
+    """
+    Entité dont la position, la vitesse, l'animation et le masque de collision sont stockés
+    dans les tableaux NumPy de la scène (voir ComponentStorage). Le mouvement (hspeed, vspeed)
+    et l'animation de toutes les ArrayEntity sont calculés en une passe vectorisée avant les step().
+    Adapté aux milliers d'entités simples (projectiles, particules). Nécessite NumPy.
+    Les durées par image des planches ne sont pas prises en compte (vitesse constante).
+    """
+
+    __slots__ = ('_storage', '_slot', '_pending')
+
+    x = _column_property('x', "Position X.")
+    y = _column_property('y', "Position Y.")
+    xprevious = _column_property('xprevious', "Position X à la frame précédente.")
+    yprevious = _column_property('yprevious', "Position Y à la frame précédente.")
+    hspeed = _column_property('hspeed', "Vitesse horizontale (pixels par frame).")
+    vspeed = _column_property('vspeed', "Vitesse verticale (pixels par frame).")
+    image_index = _column_property('image_index', "Index de l'image actuelle.")
+    image_speed = _column_property('image_speed', "Vitesse d'animation (images par frame).")
+    image_number = _column_property('image_number', "Nombre total d'images dans le sprite.")
+    image_xscale = _column_property('image_xscale', "Échelle horizontale.")
+    image_yscale = _column_property('image_yscale', "Échelle verticale.")
+    active = _column_property('active', "Si False, l'entité n'est ni déplacée ni mise à jour.")
+
+    @property
+    def _mask(self):
+        storage = self._storage
+        if storage is None:
+            return self._pending['_mask']
+        return tuple(storage.columns['_mask'][self._slot].tolist())
+
+    @_mask.setter
+    def _mask(self, value):
+        storage = self._storage
+        if storage is None:
+            self._pending['_mask'] = value
+        else:
+            storage.columns['_mask'][self._slot] = value
+
+    def __init__(self, x: float = 0, y: float = 0):
+        """
+        Initialise une nouvelle entité (ses valeurs passent dans les tableaux de la scène à son ajout).
+
+        Args:
+            x: Position X initiale
+            y: Position Y initiale
+        """
+        self._storage: Optional[ComponentStorage] = None
+        self._slot = -1
+        self._pending = dict(_COLUMN_DEFAULTS)
+        super().__init__(x, y)
+
+    def step(self):
+        """
+        Appelé à chaque frame pour la logique de mise à jour.
+        La position précédente, le mouvement et l'animation sont déjà calculés par la scène.
+        """
+        pass
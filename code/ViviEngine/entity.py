@@ -3,11 +3,27 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .scene import Scene
 
+# Masque de collision vide, partagé par toutes les entités qui n'en ont pas
+_NO_MASK = (0, 0, 0, 0)
+
 class Entity:
     """
     Classe de base pour tous les objets de jeu (équivalent d'un object dans GameMaker).
+    Les attributs sont déclarés dans __slots__ pour réduire la mémoire par entité.
+    Une sous-classe peut ajouter librement des attributs, ou déclarer ses propres
+    __slots__ pour rester compacte.
     """
     
+    __slots__ = (
+        'x', 'y', 'xprevious', 'yprevious',
+        '_sprite_handle', '_sprite_index', 'sprite_width', 'sprite_height',
+        'image_xscale', 'image_yscale', 'image_angle', 'image_alpha', 'image_blend',
+        'image_index', 'image_speed', 'image_number', '_frame_durations',
+        '_depth', 'active', '_visible', 'scene', 'id', '_render_key',
+        '_draw_bounds', '_draw_bounds_key', '_mask',
+        '__weakref__',
+    )
+    
     def __init__(self, x: float = 0, y: float = 0):
         """
         Initialise une nouvelle entité.
@@ -23,6 +39,7 @@ class Entity:
         self.yprevious = y
         
         # Sprite et rendu
+        self._sprite_handle = -1  # Identifiant du sprite (voir utils.sprite_get_handle)
         self.sprite_index: Optional[str] = None
         self.sprite_width = 0
         self.sprite_height = 0
@@ -36,23 +53,102 @@ class Entity:
         self.image_index = 0.0      # Index de l'image actuelle (float pour animation fluide)
         self.image_speed = 0.0      # Vitesse d'animation (images par frame)
         self.image_number = 1       # Nombre total d'images dans le sprite
+        self._frame_durations = None  # Durées par image du sprite (en millisecondes), si définies
         
         # Profondeur pour l'ordre de rendu (plus grand = devant)
-        self.depth = 0
+        self._depth = 0
         
         # États
         self.active = True   # Si false, step() n'est pas appelé
-        self.visible = True  # Si false, draw() n'est pas appelé
+        self._visible = True  # Si false, draw() n'est pas appelé
         
         # Références
         self.scene: Optional['Scene'] = None
         self.id = -1  # Sera assigné par la scène
+        self._render_key = None  # Clé dans la liste de rendu de la scène
         
-        # Masque de collision (optionnel)
-        self.mask_left = 0
-        self.mask_right = 0
-        self.mask_top = 0
-        self.mask_bottom = 0
+        # Boîte englobante de rendu mise en cache (pour le culling de la scène)
+        self._draw_bounds = None
+        self._draw_bounds_key = None
+        
+        # Masque de collision (optionnel) : (gauche, droite, haut, bas), voir mask_left...
+        self._mask = _NO_MASK
+        
+    @property
+    def depth(self):
+        """Profondeur pour l'ordre de rendu."""
+        return self._depth
+    
+    @depth.setter
+    def depth(self, value):
+        if value != self._depth:
+            self._depth = value
+            if self.scene:
+                self.scene._mark_render_order_dirty(self)
+    
+    @property
+    def mask_left(self) -> float:
+        """Bord gauche du masque de collision, relatif à la position."""
+        return self._mask[0]
+    
+    @mask_left.setter
+    def mask_left(self, value: float):
+        self._mask = (value,) + self._mask[1:]
+    
+    @property
+    def mask_right(self) -> float:
+        """Bord droit du masque de collision, relatif à la position."""
+        return self._mask[1]
+    
+    @mask_right.setter
+    def mask_right(self, value: float):
+        left, _, top, bottom = self._mask
+        self._mask = (left, value, top, bottom)
+    
+    @property
+    def mask_top(self) -> float:
+        """Bord haut du masque de collision, relatif à la position."""
+        return self._mask[2]
+    
+    @mask_top.setter
+    def mask_top(self, value: float):
+        left, right, _, bottom = self._mask
+        self._mask = (left, right, value, bottom)
+    
+    @property
+    def mask_bottom(self) -> float:
+        """Bord bas du masque de collision, relatif à la position."""
+        return self._mask[3]
+    
+    @mask_bottom.setter
+    def mask_bottom(self, value: float):
+        self._mask = self._mask[:3] + (value,)
+    
+    @property
+    def sprite_index(self) -> Optional[str]:
+        """Nom du sprite de l'entité."""
+        return self._sprite_index
+    
+    @sprite_index.setter
+    def sprite_index(self, value: Optional[str]):
+        self._sprite_index = value
+        if value:
+            from . import utils
+            self._sprite_handle = utils.sprite_get_handle(value)
+        else:
+            self._sprite_handle = -1
+    
+    @property
+    def visible(self) -> bool:
+        """Si False, draw() n'est pas appelé."""
+        return self._visible
+    
+    @visible.setter
+    def visible(self, value: bool):
+        if value != self._visible:
+            self._visible = value
+            if self.scene:
+                self.scene._mark_render_order_dirty(self)
         
     def create(self):
         """
@@ -76,7 +172,16 @@ class Entity:
     def _update_animation(self):
         """Met à jour l'animation du sprite."""
         if self.image_speed > 0 and self.image_number > 1:
-            self.image_index += self.image_speed
+            durations = self._frame_durations
+            if durations:
+                # Durées par image : image_speed = 1 joue l'animation à sa vitesse d'origine
+                from . import utils
+                frame = int(self.image_index)
+                duration = durations[frame] if frame < len(durations) else durations[-1]
+                fps = utils._game_instance.fps if utils._game_instance else 60
+                self.image_index += self.image_speed * (1000.0 / fps) / duration if duration > 0 else 1
+            else:
+                self.image_index += self.image_speed
             
             # Faire boucler l'animation
             if self.image_index >= self.image_number:
@@ -90,18 +195,11 @@ class Entity:
         if self.sprite_index and self.visible:
             from . import utils
             
-            # Sauvegarder les paramètres de rendu actuels
-            utils.draw_set_alpha(self.image_alpha)
-            utils.draw_set_color(self.image_blend)
-            
-            # Dessiner le sprite avec l'index d'image approprié
+            # Dessiner le sprite avec l'index d'image et la teinte de l'entité
+            # (sans modifier la couleur de dessin globale)
             current_image_index = int(self.image_index)
-            utils.draw_sprite(self.x, self.y, self.sprite_index, current_image_index,
-                            self.image_xscale, self.image_yscale, self.image_angle)
-            
-            # Restaurer les paramètres par défaut
-            utils.draw_set_alpha(1.0)
-            utils.draw_set_color((255, 255, 255))
+            utils._draw_sprite(self.x, self.y, utils.get_sprite_by_handle(self._sprite_handle), current_image_index,
+                               self.image_xscale, self.image_yscale, self.image_angle, self.image_blend)
             
     def cleanup(self):
         """
@@ -127,20 +225,45 @@ class Entity:
         
     def _update_sprite_dimensions(self):
         """Met à jour les dimensions du sprite."""
+        self._draw_bounds_key = None
         if self.sprite_index:
             from . import utils
-            sprite = utils.get_sprite(self.sprite_index)
+            sprite = utils._get_sprite_info(self._sprite_handle)
             if sprite:
                 self.sprite_width = sprite.get_width()
                 self.sprite_height = sprite.get_height()
                 self.image_number = sprite.image_count
+                self._frame_durations = sprite.frame_durations
                 
                 # Mettre à jour le masque de collision par défaut
                 # Le masque est relatif au centre du sprite
-                self.mask_left = -sprite.center_x
-                self.mask_right = self.sprite_width - sprite.center_x - 1
-                self.mask_top = -sprite.center_y
-                self.mask_bottom = self.sprite_height - sprite.center_y - 1
+                self._mask = (-sprite.center_x, self.sprite_width - sprite.center_x - 1,
+                              -sprite.center_y, self.sprite_height - sprite.center_y - 1)
+    
+    def _get_draw_bounds(self):
+        """
+        Retourne la boîte englobante (gauche, haut, droite, bas) du sprite dessiné
+        par draw(), recalculée seulement si la position ou la transformation a changé.
+        
+        Returns:
+            Tuple (gauche, haut, droite, bas), ou None si l'entité n'a pas de sprite
+        """
+        from . import utils
+        image_index = int(self.image_index)
+        sprite = utils._get_sprite_info(self._sprite_handle)
+        # Le centre et la taille de l'image peuvent changer sans changer d'identifiant
+        # (sprite_set_center, sprite_set_sheet, rechargement à chaud)
+        sprite_key = (sprite.get_origin(image_index), sprite.image_width, sprite.image_height) if sprite else None
+        key = (self.x, self.y, self._sprite_handle, self.image_xscale, self.image_yscale, self.image_angle,
+               image_index, sprite_key)
+        if key != self._draw_bounds_key:
+            if sprite:
+                self._draw_bounds = utils._get_sprite_bounds(sprite, self.x, self.y, self.image_xscale,
+                                                             self.image_yscale, self.image_angle, image_index)
+            else:
+                self._draw_bounds = None
+            self._draw_bounds_key = key
+        return self._draw_bounds
     
     def animation_end(self) -> bool:
         """
@@ -196,6 +319,24 @@ class Entity:
         bottom = self.y + self.mask_bottom * self.image_yscale
         return max(top, bottom)  # Toujours le plus grand
         
+    def _get_bbox(self):
+        """
+        Retourne la boîte de collision en une seule fois.
+        
+        Returns:
+            Tuple (gauche, haut, droite, bas)
+        """
+        mask_left, mask_right, mask_top, mask_bottom = self._mask
+        left = self.x + mask_left * self.image_xscale
+        right = self.x + mask_right * self.image_xscale
+        top = self.y + mask_top * self.image_yscale
+        bottom = self.y + mask_bottom * self.image_yscale
+        if left > right:
+            left, right = right, left
+        if top > bottom:
+            top, bottom = bottom, top
+        return (left, top, right, bottom)
+        
     def point_in_bbox(self, px: float, py: float) -> bool:
         """
         Vérifie si un point est dans la boîte de collision de l'entité.
@@ -223,16 +364,20 @@ class Entity:
             True s'il y a collision avec au moins une entité du type spécifié
         """
         # Calculer la boîte de collision de cette entité aux coordonnées personnalisées
-        self_left = x + self.mask_left * self.image_xscale
-        self_right = x + self.mask_right * self.image_xscale
-        self_top = y + self.mask_top * self.image_yscale
-        self_bottom = y + self.mask_bottom * self.image_yscale
+        mask_left, mask_right, mask_top, mask_bottom = self._mask
+        self_left = x + mask_left * self.image_xscale
+        self_right = x + mask_right * self.image_xscale
+        self_top = y + mask_top * self.image_yscale
+        self_bottom = y + mask_bottom * self.image_yscale
         
-        # Récupérer toutes les entités du type spécifié dans la scène
+        # Récupérer les entités du type spécifié proches de la zone testée
+        # (toutes les entités du type si la scène n'a pas de grille de collision)
         if not self.scene:
             return False
         
-        entities_of_type = self.scene.get_entities_of_type(entity_type)
+        entities_of_type = self.scene._get_collision_candidates(
+            entity_type, min(self_left, self_right), min(self_top, self_bottom),
+            max(self_left, self_right), max(self_top, self_bottom))
         
         # Tester la collision avec chaque entité du type
         for other in entities_of_type:
@@ -240,11 +385,7 @@ class Entity:
             if other is self:
                 continue
                 
-            # Utiliser les méthodes existantes pour l'autre entité
-            other_left = other.get_bbox_left()
-            other_right = other.get_bbox_right()
-            other_top = other.get_bbox_top()
-            other_bottom = other.get_bbox_bottom()
+            other_left, other_top, other_right, other_bottom = other._get_bbox()
             
             # Vérifier la collision
             if not (self_right < other_left or
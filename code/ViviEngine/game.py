@@ -86,10 +86,20 @@ class Game:
             scene_name: Nom de la scène à initialiser
         """
         if scene_name in self.scenes:
-            if self.current_scene:
-                self.current_scene.cleanup()
-                
+            previous_scene = self.current_scene
+            if previous_scene:
+                previous_scene.cleanup()
+            
+            # Épingler les assets de la nouvelle scène avant de libérer ceux de l'ancienne
+            # (les assets communs restent ainsi en mémoire)
+            from . import utils
             self.current_scene = self.scenes[scene_name]
+            for name in self.current_scene.assets:
+                utils.asset_pin(name)
+            if previous_scene:
+                for name in previous_scene.assets:
+                    utils.asset_unpin(name)
+                
             self.current_scene.create()
             self.next_scene = None
         else:
@@ -105,7 +115,11 @@ class Game:
         if not self.running:
             self.initialize()
             
+        from . import utils
         while self.running:
+            # Nouvelle frame (voir la fusion des sons dans play_sound)
+            utils._frame_count += 1
+            
             # Calcul du delta time
             dt = self.clock.tick(self.fps)
             self._delta_time = dt / 1000.0  # Convertir en secondes
@@ -116,7 +130,6 @@ class Game:
                     self.running = False
                     
                 # Mise à jour des états clavier/souris
-                from . import utils
                 utils._handle_pygame_event(event)
             
             # Mise à jour de la scène actuelle
@@ -130,11 +143,10 @@ class Game:
             # Gestion du changement de scène
             self._handle_scene_switch()
             
-            # Affichage
-            pygame.display.flip()
+            # Affichage (flip complet ou zones modifiées, voir display_set_dirty_rects)
+            utils._present_display()
             
             # Nettoyage de fin de frame
-            from . import utils
             utils._end_frame_cleanup()
             
         self.quit()
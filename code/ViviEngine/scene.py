@@ -1,9 +1,48 @@
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+from abc import ABCMeta
+from bisect import bisect_left
+from collections.abc import Sequence as SequenceABC
 from .entity import Entity
+from .tilemap import Tilemap
+from .spatial import SpatialHash
+from .components import ArrayEntity, ComponentStorage
 
 if TYPE_CHECKING:
     from .game import Game
 
+class _EntityView(SequenceABC):
+    """Vue en lecture seule (sans copie) d'une liste d'entités de la scène."""
+    
+    __slots__ = ('_entities',)
+    
+    def __init__(self, entities: List[Entity]):
+        self._entities = entities
+        
+    def __getitem__(self, index):
+        return self._entities[index]
+        
+    def __len__(self) -> int:
+        return len(self._entities)
+        
+    def __iter__(self):
+        return iter(self._entities)
+        
+    def __contains__(self, entity) -> bool:
+        return entity in self._entities
+        
+    def __eq__(self, other) -> bool:
+        # Comparable à une liste, comme l'ancienne valeur de retour de get_entities_of_type
+        if isinstance(other, _EntityView):
+            other = other._entities
+        if isinstance(other, list):
+            return self._entities == other
+        return NotImplemented
+        
+    __hash__ = None  # Modifiable (par la scène) : non hashable, comme une liste
+        
+    def __repr__(self) -> str:
+        return f"_EntityView({self._entities!r})"
+
 class Scene:
     """
     Représente une scène de jeu (équivalent d'une room dans GameMaker).
@@ -13,13 +52,33 @@ class Scene:
     def __init__(self):
         """Initialise une nouvelle scène."""
         self.entities: List[Entity] = []
+        self.tilemaps: List[Tilemap] = []
         self.game: Optional['Game'] = None
         self._entities_to_add: List[Entity] = []
-        self._entities_to_remove: List[Entity] = []
+        self._entities_to_remove: Dict[Entity, None] = {}  # Ensemble ordonné (ordre des destructions)
+        self._entities_by_id: Dict[int, Entity] = {}
         self._next_entity_id = 0
         
+        # Ordre de rendu persistant : entités visibles triées par (-depth, id)
+        self._render_list: List[Entity] = []
+        self._render_keys: List[Tuple[float, int]] = []
+        self._render_dirty: Set[Entity] = set()
+        self._tilemap_order: List[Tuple[Tilemap, float]] = []  # (tilemap, profondeur) dessinées à la frame précédente
+        
+        # Index par classe : classe -> entités de cette classe ou d'une sous-classe (dans l'ordre d'ajout).
+        # Une classe est indexée à sa première recherche, puis tenue à jour à chaque ajout/suppression
+        self._type_index: Dict[type, List[Entity]] = {}
+        
+        # Grille de collision optionnelle (voir set_spatial_hash)
+        self._spatial_hash: Optional[SpatialHash] = None
+        
+        # Tableaux NumPy des ArrayEntity, créés au premier ajout (voir components.py)
+        self.components: Optional[ComponentStorage] = None
+        
         # Variables de la scène
         self.background_color = (64, 128, 255)  # Couleur de fond par défaut
+        self.batch_rendering = False  # Si True, les sprites sont envoyés par lots via Surface.blits()
+        self.assets: List[str] = []  # Sprites/sons chargés à la demande, gardés en mémoire tant que la scène est active
         
     def create(self):
         """
@@ -35,10 +94,38 @@ class Scene:
         # Ajouter les nouvelles entités
         self._process_entity_additions()
         
+        # Mouvement et animation de toutes les ArrayEntity en une passe vectorisée
+        if self.components is not None:
+            self.components.step()
+        
         # Mettre à jour toutes les entités
+        spatial_hash = self._spatial_hash
+        array_step = ArrayEntity.step
+        inactive: List[Entity] = []
         for entity in self.entities:
-            if entity.active:
+            # Les ArrayEntity sans step() propre sont déjà à jour : ne pas appeler step()
+            # (ni lire active, stocké dans les tableaux, s'il n'y a pas de grille à tenir à jour)
+            if type(entity).step is array_step:
+                if spatial_hash is None:
+                    continue
+                if not entity.active:
+                    inactive.append(entity)
+                    continue
+            elif entity.active:
                 entity.step()
+            else:
+                inactive.append(entity)
+                continue
+            # Les collisions testées par les entités suivantes voient la nouvelle position.
+            # Une entité déplacée par une autre après son propre step() est rangée à son prochain step()
+            if spatial_hash is not None:
+                spatial_hash.update(entity, *entity._get_bbox())
+        
+        # Les entités inactives ne sont pas rangées par la boucle : elles ne bougent
+        # que si une autre entité les déplace
+        if spatial_hash is not None:
+            for entity in inactive:
+                spatial_hash.update(entity, *entity._get_bbox())
                 
         # Supprimer les entités marquées pour suppression
         self._process_entity_removals()
@@ -46,26 +133,104 @@ class Scene:
     def draw(self):
         """
         Appelé à chaque frame pour le rendu avec support caméra.
+        Si des caméras sont activées avec camera_set_enabled(), la scène est
+        rendue dans chacune d'elles (écran partagé, mini-carte...).
         """
         from . import utils
         
+        # Mettre à jour l'ordre de rendu (une seule fois, partagé par toutes les caméras)
+        self._update_render_order()
+        tilemaps = [tilemap for tilemap in self.tilemaps if tilemap.visible]
+        tilemaps.sort(key=lambda t: t.depth, reverse=True)
+        
+        # Comme pour les entités, un changement de profondeur d'une tilemap
+        # échappe à l'affichage par zones modifiées
+        tilemap_order = [(tilemap, tilemap.depth) for tilemap in tilemaps]
+        if tilemap_order != self._tilemap_order:
+            self._tilemap_order = tilemap_order
+            utils.display_invalidate()
+        
+        cameras = utils._get_enabled_cameras()
+        if not cameras:
+            self._draw_view(tilemaps)
+            return
+        
+        # Rendre chaque caméra activée en la rendant temporairement active
+        active_camera = utils._active_camera
+        try:
+            for camera_id in cameras:
+                utils._active_camera = camera_id
+                self._draw_view(tilemaps)
+        finally:
+            utils._active_camera = active_camera
+            
+    def _draw_view(self, tilemaps: List[Tilemap]):
+        """Rend la scène dans la caméra active (ou directement à l'écran)."""
+        from . import utils
+        
         # Commencer le rendu de caméra
         utils._begin_camera_render()
         
         # Effacer la surface de caméra avec la couleur de fond
         utils.draw_clear(self.background_color)
         
-        # Trier les entités par profondeur (depth) pour l'ordre de rendu
-        sorted_entities = sorted([e for e in self.entities if e.visible], 
-                               key=lambda x: x.depth, reverse=True)
-        
-        # Dessiner toutes les entités visibles
-        for entity in sorted_entities:
-            entity.draw()
+        # Dessiner toutes les entités visibles et les tilemaps
+        if self.batch_rendering:
+            utils._begin_blit_batch()
+            try:
+                self._draw_layers(tilemaps)
+            finally:
+                utils._end_blit_batch()
+        else:
+            self._draw_layers(tilemaps)
         
         # Terminer le rendu de caméra et l'afficher à l'écran
         utils._end_camera_render()
             
+    def _draw_layers(self, tilemaps: List[Tilemap]):
+        """Dessine les entités (déjà triées par profondeur) et les tilemaps (triées) à leur profondeur."""
+        entities = self._get_entities_in_view()
+        if not tilemaps:
+            for entity in entities:
+                entity.draw()
+            return
+        
+        # Intercaler les tilemaps (peu nombreuses) dans l'ordre de rendu
+        next_tilemap = 0
+        for entity in entities:
+            while next_tilemap < len(tilemaps) and tilemaps[next_tilemap].depth >= entity.depth:
+                tilemaps[next_tilemap].draw()
+                next_tilemap += 1
+            entity.draw()
+        for tilemap in tilemaps[next_tilemap:]:
+            tilemap.draw()
+            
+    def _get_entities_in_view(self) -> List[Entity]:
+        """
+        Retourne les entités de la liste de rendu à dessiner dans la vue courante.
+        Les entités utilisant le draw() par défaut sont écartées sans être appelées
+        si la boîte englobante de leur sprite est hors de la vue.
+        """
+        from . import utils
+        
+        view = utils._get_view_rect()
+        if view is None:
+            return self._render_list
+        left, top, width, height = view
+        right = left + width
+        bottom = top + height
+        
+        default_draw = Entity.draw
+        entities = []
+        for entity in self._render_list:
+            if type(entity).draw is default_draw:
+                bounds = entity._get_draw_bounds()
+                if (bounds is None or bounds[2] < left or bounds[0] > right or
+                        bounds[3] < top or bounds[1] > bottom):
+                    continue
+            entities.append(entity)
+        return entities
+            
     def cleanup(self):
         """
         Appelé lors de la fermeture de la scène.
@@ -74,9 +239,91 @@ class Scene:
         # Nettoyer toutes les entités
         for entity in self.entities:
             entity.cleanup()
+            entity._render_key = None
         self.entities.clear()
         self._entities_to_add.clear()
         self._entities_to_remove.clear()
+        self._entities_by_id.clear()
+        self._render_list.clear()
+        self._render_keys.clear()
+        self._render_dirty.clear()
+        self.tilemaps.clear()
+        for entities in self._type_index.values():
+            entities.clear()
+        if self._spatial_hash is not None:
+            self._spatial_hash.clear()
+        if self.components is not None:
+            self.components.clear()
+        
+    def add_tilemap(self, tilemap: Tilemap) -> Tilemap:
+        """
+        Ajoute une couche de tuiles à la scène.
+        
+        Args:
+            tilemap: La tilemap à ajouter
+            
+        Returns:
+            La tilemap ajoutée
+        """
+        self.tilemaps.append(tilemap)
+        return tilemap
+        
+    def remove_tilemap(self, tilemap: Tilemap):
+        """
+        Retire une couche de tuiles de la scène.
+        
+        Args:
+            tilemap: La tilemap à retirer
+        """
+        if tilemap in self.tilemaps:
+            self.tilemaps.remove(tilemap)
+        
+    def set_spatial_hash(self, cell_size: Optional[int] = 64):
+        """
+        Active une grille de collision : bbox_collision() et get_entities_in_region()
+        ne testent alors que les entités proches au lieu de toutes les entités.
+        Intéressant à partir de quelques centaines d'entités.
+        
+        Args:
+            cell_size: Taille d'une cellule en pixels (None pour désactiver la grille)
+        """
+        if cell_size is None:
+            self._spatial_hash = None
+            return
+        self._spatial_hash = SpatialHash(cell_size)
+        for entity in self.entities:
+            self._spatial_hash.update(entity, *entity._get_bbox())
+        
+    def get_entities_in_region(self, left: float, top: float, right: float, bottom: float,
+                               entity_type=None) -> List[Entity]:
+        """
+        Retourne les entités dont la boîte de collision touche une zone.
+        
+        Args:
+            left, top, right, bottom: Limites de la zone
+            entity_type: Type/classe d'entité recherché (optionnel)
+            
+        Returns:
+            Liste des entités de la zone
+        """
+        found = []
+        for entity in self._get_collision_candidates(entity_type, left, top, right, bottom):
+            other_left, other_top, other_right, other_bottom = entity._get_bbox()
+            if not (right < other_left or left > other_right or
+                    bottom < other_top or top > other_bottom):
+                found.append(entity)
+        return found
+        
+    def _get_collision_candidates(self, entity_type, left: float, top: float, right: float, bottom: float) -> List[Entity]:
+        """Retourne les entités d'un type pouvant toucher une zone (toutes sans grille de collision)."""
+        if self._spatial_hash is None:
+            if entity_type is None:
+                return self.entities
+            return self.get_entities_of_type(entity_type)
+        candidates = self._spatial_hash.query(left, top, right, bottom)
+        if entity_type is None:
+            return candidates
+        return [entity for entity in candidates if isinstance(entity, entity_type)]
         
     def add_entity(self, entity: Entity):
         """
@@ -96,8 +343,8 @@ class Scene:
         Args:
             entity: L'entité à supprimer
         """
-        if entity in self.entities and entity not in self._entities_to_remove:
-            self._entities_to_remove.append(entity)
+        if self._entities_by_id.get(entity.id) is entity and entity not in self._entities_to_remove:
+            self._entities_to_remove[entity] = None
             
     def get_entity_by_id(self, entity_id: int) -> Optional[Entity]:
         """
@@ -109,12 +356,9 @@ class Scene:
         Returns:
             L'entité trouvée ou None
         """
-        for entity in self.entities:
-            if entity.id == entity_id:
-                return entity
-        return None
+        return self._entities_by_id.get(entity_id)
         
-    def get_entities_of_type(self, entity_type) -> List[Entity]:
+    def get_entities_of_type(self, entity_type) -> Sequence[Entity]:
         """
         Retourne toutes les entités d'un type donné.
         
@@ -122,9 +366,14 @@ class Scene:
             entity_type: Type/classe d'entité recherché
             
         Returns:
-            Liste des entités du type spécifié
+            Séquence en lecture seule des entités du type spécifié, tenue à jour
+            par la scène (utiliser list() pour en garder une copie)
         """
-        return [entity for entity in self.entities if isinstance(entity, entity_type)]
+        entities = self._get_type_list(entity_type)
+        if entities is None:
+            # Tuple de classes ou classe abstraite : sous-classes virtuelles hors MRO
+            return [entity for entity in self.entities if isinstance(entity, entity_type)]
+        return _EntityView(entities)
         
     def count_entities_of_type(self, entity_type) -> int:
         """
@@ -138,6 +387,16 @@ class Scene:
         """
         return len(self.get_entities_of_type(entity_type))
         
+    def _get_type_list(self, entity_type) -> Optional[List[Entity]]:
+        """Retourne la liste indexée d'une classe (créée au premier appel), None si elle ne peut pas être indexée."""
+        entities = self._type_index.get(entity_type)
+        if entities is None:
+            if not isinstance(entity_type, type) or isinstance(entity_type, ABCMeta):
+                return None
+            entities = self._type_index[entity_type] = [
+                entity for entity in self.entities if isinstance(entity, entity_type)]
+        return entities
+        
     def _get_next_entity_id(self) -> int:
         """Génère un ID unique pour une nouvelle entité."""
         entity_id = self._next_entity_id
@@ -148,13 +407,100 @@ class Scene:
         """Traite les entités en attente d'ajout."""
         for entity in self._entities_to_add:
             self.entities.append(entity)
+            self._entities_by_id[entity.id] = entity
+            self._render_insert(entity)
+            for cls in type(entity).__mro__:
+                entities = self._type_index.get(cls)
+                if entities is not None:
+                    entities.append(entity)
+            if isinstance(entity, ArrayEntity):
+                if self.components is None:
+                    self.components = ComponentStorage()
+                self.components.add(entity)
             entity.create()  # Appeler create() après l'ajout à la scène
+            if self._spatial_hash is not None:
+                self._spatial_hash.update(entity, *entity._get_bbox())
         self._entities_to_add.clear()
         
     def _process_entity_removals(self):
         """Traite les entités en attente de suppression."""
-        for entity in self._entities_to_remove:
-            if entity in self.entities:
-                entity.cleanup()
-                self.entities.remove(entity)
-        self._entities_to_remove.clear()
\ No newline at end of file
+        if not self._entities_to_remove:
+            return
+        removed: Set[Entity] = set()
+        # cleanup() peut détruire d'autres entités : traiter aussi ces nouvelles demandes
+        while self._entities_to_remove:
+            batch = list(self._entities_to_remove)
+            self._entities_to_remove.clear()
+            for entity in batch:
+                if self._entities_by_id.get(entity.id) is entity:
+                    entity.cleanup()
+                    del self._entities_by_id[entity.id]
+                    if self._spatial_hash is not None:
+                        self._spatial_hash.remove(entity)
+                    if isinstance(entity, ArrayEntity):
+                        self.components.remove(entity)
+                    removed.add(entity)
+        if not removed:
+            return
+        
+        # Compacter en une passe (sur place) la liste des entités et la liste de rendu
+        self.entities[:] = [entity for entity in self.entities if entity not in removed]
+        if any(entity._render_key is not None for entity in removed):
+            self._render_list[:] = [entity for entity in self._render_list if entity not in removed]
+            self._render_keys[:] = [entity._render_key for entity in self._render_list]
+            for entity in removed:
+                entity._render_key = None
+        self._render_dirty.difference_update(removed)
+        
+        # Compacter les listes des classes concernées
+        classes = {cls for entity in removed for cls in type(entity).__mro__}
+        for cls in classes:
+            entities = self._type_index.get(cls)
+            if entities is not None:
+                entities[:] = [entity for entity in entities if entity not in removed]
+        
+    def _mark_render_order_dirty(self, entity: Entity):
+        """Signale que la profondeur ou la visibilité d'une entité a changé."""
+        self._render_dirty.add(entity)
+        
+    def _update_render_order(self):
+        """Réinsère dans la liste de rendu uniquement les entités modifiées."""
+        if not self._render_dirty:
+            return
+        order_changed = False
+        for entity in self._render_dirty:
+            # Ignorer les entités pas encore ajoutées ou déjà supprimées
+            if entity._render_key is not None and entity.scene is self:
+                previous_key = entity._render_key
+                self._render_remove(entity)
+                self._render_insert(entity)
+                if entity.visible and entity._render_key != previous_key:
+                    order_changed = True
+        self._render_dirty.clear()
+        
+        # Un changement d'ordre ne modifie ni les images ni leurs positions :
+        # l'affichage par zones modifiées ne le verrait pas
+        if order_changed:
+            from . import utils
+            utils.display_invalidate()
+        
+    def _render_insert(self, entity: Entity):
+        """Insère une entité à sa place dans la liste de rendu."""
+        # Profondeur décroissante, puis ordre d'ajout
+        key = (-entity.depth, entity.id)
+        entity._render_key = key
+        if entity.visible:
+            index = bisect_left(self._render_keys, key)
+            self._render_keys.insert(index, key)
+            self._render_list.insert(index, entity)
+            
+    def _render_remove(self, entity: Entity):
+        """Retire une entité de la liste de rendu."""
+        key = entity._render_key
+        if key is None:
+            return
+        index = bisect_left(self._render_keys, key)
+        if index < len(self._render_keys) and self._render_keys[index] == key:
+            del self._render_keys[index]
+            del self._render_list[index]
+        entity._render_key = None
\ No newline at end of file
@@ -0,0 +1,89 @@
+from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+class SpatialHash:
+    """
+    Grille uniforme qui range les entités par cellules selon leur boîte de collision.
+    Une recherche dans une zone ne parcourt que les entités des cellules qu'elle touche.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Initialise une grille vide.
+
+        Args:
+            cell_size: Taille d'une cellule en pixels (de l'ordre de la taille des entités)
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set['Entity']] = {}
+        self._ranges: Dict['Entity', Tuple[int, int, int, int]] = {}  # entité -> cellules couvertes
+
+    def update(self, entity: 'Entity', left: float, top: float, right: float, bottom: float):
+        """
+        Range (ou re-range) une entité selon sa boîte de collision.
+        Rien n'est fait si l'entité couvre toujours les mêmes cellules.
+        """
+        size = self.cell_size
+        cell_range = (int(left // size), int(top // size), int(right // size), int(bottom // size))
+        previous = self._ranges.get(entity)
+        if previous == cell_range:
+            return
+        if previous is not None:
+            self._remove_cells(entity, previous)
+
+        self._ranges[entity] = cell_range
+        first_cx, first_cy, last_cx, last_cy = cell_range
+        cells = self._cells
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = set()
+                cell.add(entity)
+
+    def remove(self, entity: 'Entity'):
+        """Retire une entité de la grille."""
+        cell_range = self._ranges.pop(entity, None)
+        if cell_range is not None:
+            self._remove_cells(entity, cell_range)
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> List['Entity']:
+        """
+        Retourne les entités rangées dans les cellules touchées par une zone.
+        Ce sont des candidates : leur boîte doit encore être comparée à la zone.
+        """
+        size = self.cell_size
+        first_cx, first_cy = int(left // size), int(top // size)
+        last_cx, last_cy = int(right // size), int(bottom // size)
+        cells = self._cells
+
+        if first_cx == last_cx and first_cy == last_cy:
+            cell = cells.get((first_cx, first_cy))
+            return list(cell) if cell else []
+
+        found: Set['Entity'] = set()
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def clear(self):
+        """Vide la grille."""
+        self._cells.clear()
+        self._ranges.clear()
+
+    def _remove_cells(self, entity: 'Entity', cell_range: Tuple[int, int, int, int]):
+        """Retire une entité des cellules d'une plage."""
+        first_cx, first_cy, last_cx, last_cy = cell_range
+        cells = self._cells
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(entity)
+                    if not cell:
+                        del cells[(cx, cy)]
@@ -0,0 +1,204 @@
+import pygame
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+class Tilemap:
+    """
+    Couche de tuiles (équivalent d'un tile layer dans GameMaker).
+    Les indices de tuiles sont stockés dans un tableau compact et la carte est
+    découpée en chunks pré-rendus ; seuls les chunks visibles par la caméra sont dessinés.
+    Les chunks pré-rendus sont gardés dans un cache LRU à budget mémoire : sur une grande carte,
+    ceux qui ne sont plus vus depuis longtemps sont libérés puis re-rendus au besoin.
+    """
+
+    def __init__(self, sprite_name: str, width: int, height: int, x: float = 0, y: float = 0, chunk_size: int = 16,
+                 cache_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialise une nouvelle couche de tuiles vide.
+
+        Args:
+            sprite_name: Nom du sprite servant de tileset (une image par tuile)
+            width: Largeur de la carte en tuiles
+            height: Hauteur de la carte en tuiles
+            x: Position X de la carte dans le monde
+            y: Position Y de la carte dans le monde
+            chunk_size: Taille d'un chunk en tuiles
+            cache_bytes: Mémoire maximale des chunks pré-rendus gardés en cache (en octets)
+        """
+        self.sprite_name = sprite_name
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.chunk_size = chunk_size
+
+        # Profondeur pour l'ordre de rendu (même convention que Entity.depth)
+        self.depth = 0
+        self.visible = True
+
+        # Indices des tuiles (-1 = vide), ligne par ligne
+        self._tiles = array('i', [-1]) * (width * height)
+
+        # Chunks pré-rendus : (cx, cy) -> surface, et chunks connus pour être vides
+        from .utils import _SurfaceCache
+        self._chunks = _SurfaceCache(cache_bytes)
+        self._empty_chunks: Set[Tuple[int, int]] = set()
+
+    def set_tile(self, tx: int, ty: int, index: int):
+        """
+        Change une tuile. Seul le chunk qui la contient sera re-rendu.
+
+        Args:
+            tx, ty: Position de la tuile (en tuiles)
+            index: Index de l'image du tileset (-1 pour vider la case)
+        """
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            offset = ty * self.width + tx
+            if self._tiles[offset] != index:
+                self._tiles[offset] = index
+                key = (tx // self.chunk_size, ty // self.chunk_size)
+                self._chunks.remove(key)
+                self._empty_chunks.discard(key)
+
+    def get_tile(self, tx: int, ty: int) -> int:
+        """
+        Retourne l'index d'une tuile.
+
+        Args:
+            tx, ty: Position de la tuile (en tuiles)
+
+        Returns:
+            Index de la tuile, -1 si vide ou hors de la carte
+        """
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self._tiles[ty * self.width + tx]
+        return -1
+
+    def get_tile_at(self, x: float, y: float) -> int:
+        """
+        Retourne l'index de la tuile sous une position du monde.
+
+        Args:
+            x, y: Position dans le monde
+
+        Returns:
+            Index de la tuile, -1 si vide ou hors de la carte
+        """
+        tile_width, tile_height = self._get_tile_size()
+        if tile_width == 0 or tile_height == 0:
+            return -1
+        return self.get_tile(int((x - self.x) // tile_width), int((y - self.y) // tile_height))
+
+    def fill(self, index: int):
+        """
+        Remplit toute la carte avec une tuile.
+
+        Args:
+            index: Index de la tuile (-1 pour vider la carte)
+        """
+        self._tiles = array('i', [index]) * (self.width * self.height)
+        self._clear_chunks()
+
+    def load(self, rows: List[List[int]]):
+        """
+        Charge les tuiles depuis une liste de lignes.
+
+        Args:
+            rows: Liste de lignes d'indices (rows[ty][tx])
+        """
+        for ty, row in enumerate(rows[:self.height]):
+            start = ty * self.width
+            row = list(row[:self.width])
+            self._tiles[start:start + len(row)] = array('i', row)
+        self._clear_chunks()
+
+    def invalidate(self):
+        """Force le re-rendu de tous les chunks (ex: après modification du tileset)."""
+        self._clear_chunks()
+
+    def draw(self):
+        """Dessine les chunks qui intersectent la vue de la caméra active."""
+        if not self.visible:
+            return
+        from . import utils
+
+        tile_width, tile_height = self._get_tile_size()
+        view = utils._get_view_rect()
+        if tile_width == 0 or tile_height == 0 or view is None:
+            return
+        view_x, view_y, view_width, view_height = view
+
+        # Chunks couverts par la vue
+        chunk_width = self.chunk_size * tile_width
+        chunk_height = self.chunk_size * tile_height
+        first_cx = max(0, int((view_x - self.x) // chunk_width))
+        first_cy = max(0, int((view_y - self.y) // chunk_height))
+        last_cx = min((self.width - 1) // self.chunk_size, int((view_x + view_width - self.x) // chunk_width))
+        last_cy = min((self.height - 1) // self.chunk_size, int((view_y + view_height - self.y) // chunk_height))
+
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                key = (cx, cy)
+                if key in self._empty_chunks:
+                    continue
+                surface = self._chunks.get(key)
+                if surface is None:
+                    surface = self._bake_chunk(cx, cy, tile_width, tile_height)
+                    if surface is None:
+                        self._empty_chunks.add(key)
+                    else:
+                        self._chunks.put(key, surface)
+                if surface is not None:
+                    utils._blit(surface, (self.x + cx * chunk_width - view_x,
+                                          self.y + cy * chunk_height - view_y))
+
+    def set_cache_budget(self, max_bytes: int):
+        """
+        Change la mémoire maximale des chunks pré-rendus gardés en cache.
+
+        Args:
+            max_bytes: Budget en octets
+        """
+        self._chunks.set_max_bytes(max_bytes)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache de chunks (voir _SurfaceCache.get_stats)."""
+        return self._chunks.get_stats()
+
+    def _clear_chunks(self):
+        """Oublie tous les chunks pré-rendus."""
+        self._chunks.discard(lambda key: True)
+        self._empty_chunks.clear()
+
+    def _get_tile_size(self) -> Tuple[int, int]:
+        """Retourne la taille d'une tuile (taille d'une image du tileset)."""
+        from . import utils
+        sprite = utils.get_sprite(self.sprite_name)
+        if not sprite:
+            return (0, 0)
+        return (sprite.get_width(), sprite.get_height())
+
+    def _bake_chunk(self, cx: int, cy: int, tile_width: int, tile_height: int) -> Optional[pygame.Surface]:
+        """Pré-rend un chunk dans une surface. Retourne None si le chunk est vide."""
+        from . import utils
+        sprite = utils.get_sprite(self.sprite_name)
+
+        first_tx = cx * self.chunk_size
+        first_ty = cy * self.chunk_size
+        columns = min(self.chunk_size, self.width - first_tx)
+        rows = min(self.chunk_size, self.height - first_ty)
+
+        blits = []
+        for row in range(rows):
+            start = (first_ty + row) * self.width + first_tx
+            for column, index in enumerate(self._tiles[start:start + columns]):
+                if index >= 0:
+                    blits.append((sprite.get_image(index), (column * tile_width, row * tile_height)))
+        if not blits:
+            return None
+
+        surface = pygame.Surface((columns * tile_width, rows * tile_height), pygame.SRCALPHA)
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        surface.blits(blits, doreturn=False)
+        return surface
@@ -1,50 +1,157 @@
 import pygame
 import os
-from typing import Dict, List, Any, Tuple, Optional, Union
+from typing import Dict, List, Any, Tuple, Optional, Union, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import math
+import json
+import hashlib
+import struct
+import threading
+import time
+from .atlas import TextureAtlas
+from .archive import AssetArchive, write_archive
 
+# Stockage des assets
+# Chaque sprite reçoit un identifiant entier stable (handle), index dans _sprite_list :
+# le rendu des entités n'a ainsi pas à rechercher le sprite par son nom
 _sprites: Dict[str, 'Sprite'] = {}
+_sprite_handles: Dict[str, int] = {}
+_sprite_list: List[Optional['Sprite']] = []
 _sounds: Dict[str, pygame.mixer.Sound] = {}
+_music: Dict[str, str] = {}  # nom -> fichier (lu en streaming, jamais décodé entièrement)
 _fonts: Dict[str, pygame.font.Font] = {}
+_font_families: Dict[str, Tuple[str, int]] = {}  # nom -> (fichier, taille de base)
 
 class Sprite:
-    """Classe pour gérer les sprites avec support multi-images et centre personnalisé."""
+    """
+    Classe pour gérer les sprites avec support multi-images et centre personnalisé.
+    Les images sont des sous-surfaces de la planche (bande horizontale ou grille) :
+    les pixels ne sont stockés qu'une fois.
+    """
     
-    def __init__(self, surface: pygame.Surface, name: str, image_count: int = 1):
+    def __init__(self, surface: Optional[pygame.Surface], name: str, image_count: int = 1, path: Optional[str] = None):
+        """
+        Args:
+            surface: Surface contenant toutes les images (None pour un sprite chargé à la demande)
+            name: Nom du sprite
+            image_count: Nombre d'images dans la surface
+            path: Fichier source, si le sprite est chargé à la demande (voir asset_set_budget)
+        """
         self.name = name
-        self.full_surface = surface
+        self.full_surface = None
         self.image_count = image_count
         self.images: List[pygame.Surface] = []
+        self.path = path
+        
+        # Disposition de la planche (une bande horizontale par défaut)
+        self.columns = image_count
+        self.rows = 1
+        self.padding = 0  # Espace entre deux images
+        self.margin = 0   # Bordure autour de la grille
+        
+        # Métadonnées optionnelles par image (voir set_sheet)
+        self.frame_origins: Optional[List[Tuple[int, int]]] = None
+        self.frame_durations: Optional[List[float]] = None  # En millisecondes
         
-        # Calculer les dimensions d'une seule image
-        self.image_width = surface.get_width() // image_count
-        self.image_height = surface.get_height()
+        # Dimensions de la planche et d'une seule image (lues à l'enregistrement pour un sprite à la demande)
+        self.sheet_size: Optional[Tuple[int, int]] = None
+        self.image_width = 0
+        self.image_height = 0
         
         # Centre par défaut (haut-gauche)
         self.center_x = 0
         self.center_y = 0
         
         # Diviser la surface en images individuelles
-        self._split_images()
+        if surface is not None:
+            self._set_surface(surface)
     
-    def _split_images(self):
-        """Divise la surface principale en images individuelles."""
+    def _split_images(self, copy: bool = False):
+        """
+        Divise la surface principale en images individuelles (ligne par ligne).
+        
+        Args:
+            copy: Si True, chaque image reçoit ses propres pixels au lieu d'être une sous-surface
+        """
         self.images.clear()
+        surface_width, surface_height = self.full_surface.get_size()
         
         for i in range(self.image_count):
-            x = i * self.image_width
-            # Vérifier que l'image rentre dans la surface
-            if x + self.image_width <= self.full_surface.get_width():
-                image_rect = pygame.Rect(x, 0, self.image_width, self.image_height)
-                image = self.full_surface.subsurface(image_rect).copy()
-                self.images.append(image)
-            else:
-                # Si l'image ne rentre pas, prendre ce qui reste
-                remaining_width = self.full_surface.get_width() - x
-                if remaining_width > 0:
-                    image_rect = pygame.Rect(x, 0, remaining_width, self.image_height)
-                    image = self.full_surface.subsurface(image_rect).copy()
-                    self.images.append(image)
+            x = self.margin + (i % self.columns) * (self.image_width + self.padding)
+            y = self.margin + (i // self.columns) * (self.image_height + self.padding)
+            # Si l'image ne rentre pas entièrement, prendre ce qui reste
+            image_rect = pygame.Rect(x, y, self.image_width, self.image_height).clip(
+                pygame.Rect(0, 0, surface_width, surface_height))
+            if image_rect.width <= 0 or image_rect.height <= 0:
+                continue
+            image = self.full_surface.subsurface(image_rect)
+            self.images.append(image.copy() if copy else image)
+    
+    def _set_surface(self, surface: pygame.Surface, copy: bool = False):
+        """Remplace la surface principale et redécoupe les images."""
+        self.full_surface = surface
+        self._set_sheet_size(surface.get_width(), surface.get_height())
+        self._split_images(copy)
+    
+    def _set_sheet_size(self, width: int, height: int):
+        """Enregistre la taille de la planche et calcule les dimensions d'une seule image."""
+        self.sheet_size = (width, height)
+        self.image_width = max(1, (width - 2 * self.margin - (self.columns - 1) * self.padding) // self.columns)
+        self.image_height = max(1, (height - 2 * self.margin - (self.rows - 1) * self.padding) // self.rows)
+    
+    def set_sheet(self, columns: int, rows: int = 1, image_count: Optional[int] = None,
+                  padding: int = 0, margin: int = 0, origins: Optional[List[Tuple[int, int]]] = None,
+                  durations: Optional[List[float]] = None):
+        """
+        Définit la disposition de la planche et redécoupe les images.
+        
+        Args:
+            columns: Nombre de colonnes de la grille
+            rows: Nombre de lignes de la grille
+            image_count: Nombre d'images (columns * rows par défaut, pour une dernière ligne incomplète)
+            padding: Espace entre deux images en pixels
+            margin: Bordure autour de la grille en pixels
+            origins: Centre (x, y) de chaque image (le centre du sprite par défaut)
+            durations: Durée de chaque image en millisecondes (animation à vitesse constante par défaut)
+        """
+        self.columns = max(1, columns)
+        self.rows = max(1, rows)
+        self.image_count = image_count if image_count else self.columns * self.rows
+        self.padding = padding
+        self.margin = margin
+        self.frame_origins = [tuple(origin) for origin in origins] if origins else None
+        self.frame_durations = list(durations) if durations else None
+        if self.full_surface is not None:
+            self._set_surface(self.full_surface)
+        elif self.sheet_size is not None:
+            self._set_sheet_size(*self.sheet_size)
+    
+    def _get_sheet(self) -> Dict[str, Any]:
+        """Retourne la disposition de la planche (mêmes clés que les fichiers de métadonnées)."""
+        return {
+            'columns': self.columns,
+            'rows': self.rows,
+            'count': self.image_count,
+            'padding': self.padding,
+            'margin': self.margin,
+            'origin': [self.center_x, self.center_y],
+            'origins': [list(origin) for origin in self.frame_origins] if self.frame_origins else None,
+            'durations': self.frame_durations,
+        }
+    
+    def _apply_sheet(self, sheet: Dict[str, Any]):
+        """Applique une disposition lue dans un fichier de métadonnées ou une archive."""
+        columns = sheet.get('columns', self.image_count)
+        self.set_sheet(columns, sheet.get('rows', 1), sheet.get('count'), sheet.get('padding', 0),
+                       sheet.get('margin', 0), sheet.get('origins'), sheet.get('durations'))
+        if 'origin' in sheet:
+            self.set_center(*sheet['origin'])
+    
+    def _unload(self):
+        """Libère les pixels du sprite (les dimensions et le centre sont conservés)."""
+        self.full_surface = None
+        self.images.clear()
     
     def get_image(self, index: int = 0) -> pygame.Surface:
         """Retourne l'image à l'index spécifié."""
@@ -57,6 +164,12 @@ class Sprite:
         self.center_x = x
         self.center_y = y
     
+    def get_origin(self, index: int = 0) -> Tuple[int, int]:
+        """Retourne le centre de l'image à l'index spécifié."""
+        if self.frame_origins and 0 <= index < len(self.frame_origins):
+            return self.frame_origins[index]
+        return (self.center_x, self.center_y)
+    
     def get_width(self) -> int:
         """Retourne la largeur d'une image."""
         return self.image_width
@@ -65,52 +178,340 @@ class Sprite:
         """Retourne la hauteur d'une image."""
         return self.image_height
 
-def load_sprite(filepath: str, sprite_name: Optional[str] = None, center_x = 0, center_y = 0) -> bool:
+def load_sprite(filepath: str, sprite_name: Optional[str] = None, center_x: Optional[int] = None,
+                center_y: Optional[int] = None, lazy: bool = False) -> bool:
     """
     Charge un sprite depuis un fichier.
     
     Args:
         filepath: Chemin vers le fichier image
         name: Nom du sprite (optionnel, utilise le nom du fichier par défaut)
+        center_x, center_y: Centre du sprite (optionnel, celui du fichier de métadonnées
+                            ou le coin haut-gauche par défaut)
+        lazy: Si True, seul le chemin est enregistré ; l'image est décodée au premier
+              get_sprite() et peut être libérée selon le budget mémoire (voir asset_set_budget)
     
     Returns:
         True si le chargement a réussi
     """
     try:
-        name = os.path.splitext(os.path.basename(filepath))[0]
+        # Détecter si c'est un sprite strip
+        name, image_count = _parse_sprite_filename(filepath)
+        if sprite_name is None:
+            sprite_name = name
         
-        # Charger la surface
-        surface = pygame.image.load(filepath).convert_alpha()
+        if lazy:
+            sprite = _register_lazy_sprite(sprite_name, filepath)
+            _override_center(sprite, center_x, center_y)
+            print(f"Sprite '{sprite_name}' enregistré ({sprite.image_count} image(s), chargement à la demande)")
+            return True
         
-        # Détecter si c'est un sprite strip
-        image_count = 1
-        if "_strip" in name:
-            try:
-                strip_part = name.split("_strip")[1]
-                image_count = int(strip_part)
-                name = name.split("_strip")[0]
-            except (IndexError, ValueError) as e:
-                image_count = 1
+        # Charger la surface
+        surface = _prepare_image(_decode_image(filepath))
         
         # Créer et stocker le sprite
-        sprite = Sprite(surface, sprite_name, image_count)
-        _sprites[sprite_name] = sprite
-        sprite_set_center(sprite_name, center_x, center_y)
+        sprite = _create_sprite(sprite_name, filepath, surface)
+        _asset_forget('sprite', sprite_name)
+        _register_sprite(sprite_name, sprite)
+        _override_center(sprite, center_x, center_y)
         
-        print(f"Sprite '{sprite_name}' chargé avec {image_count} image(s)")
+        print(f"Sprite '{sprite_name}' chargé avec {sprite.image_count} image(s)")
         return True
         
-    except pygame.error as e:
+    except (pygame.error, OSError) as e:
         print(f"Erreur lors du chargement du sprite '{filepath}': {e}")
         return False
 
-def load_sound(filepath: str, name: Optional[str] = None) -> bool:
+def _override_center(sprite: Sprite, center_x: Optional[int], center_y: Optional[int]):
+    """Applique le centre donné à load_sprite (le centre du fichier de métadonnées est conservé sinon)."""
+    sprite.set_center(sprite.center_x if center_x is None else center_x,
+                      sprite.center_y if center_y is None else center_y)
+
+def _create_sprite(name: str, filepath: str, surface: Optional[pygame.Surface] = None, lazy: bool = False) -> Sprite:
+    """Crée un sprite pour un fichier image (surface None pour un sprite à la demande)."""
+    sprite = Sprite(None, name, 1, path=filepath if lazy else None)
+    _configure_sprite(sprite, filepath)
+    if surface is not None:
+        sprite._set_surface(surface)
+    return sprite
+
+def _configure_sprite(sprite: Sprite, filepath: str):
+    """
+    Définit la disposition d'un sprite d'après son fichier : bande "_strip<N>" ou
+    fichier de métadonnées JSON voisin (ex: "player.json" pour "player.png") avec les clés
+    columns, rows, count, padding, margin, origin, origins et durations (en millisecondes).
+    """
+    _, image_count = _parse_sprite_filename(filepath)
+    sprite.set_sheet(image_count)
+    
+    sheet_path = os.path.splitext(filepath)[0] + '.json'
+    if os.path.exists(sheet_path):
+        try:
+            with open(sheet_path, 'r', encoding='utf-8') as file:
+                sprite._apply_sheet(json.load(file))
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Warning: métadonnées de sprite ignorées '{sheet_path}': {e}")
+
+def _parse_sprite_filename(filepath: str) -> Tuple[str, int]:
+    """
+    Extrait le nom du sprite et son nombre d'images d'un nom de fichier
+    (ex: "player_strip4.png" -> ("player", 4)).
+    """
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    image_count = 1
+    if "_strip" in name:
+        try:
+            strip_part = name.split("_strip")[1]
+            image_count = int(strip_part)
+            name = name.split("_strip")[0]
+        except (IndexError, ValueError) as e:
+            image_count = 1
+    return name, image_count
+
+# Cache disque des images décodées (voir asset_cache_enable)
+_decode_cache_dir: Optional[str] = None
+_decode_cache_max_bytes = 256 * 1024 * 1024
+_decode_cache_bytes = 0
+_decode_cache_lock = threading.Lock()
+_decode_cache_stats = {'hits': 0, 'misses': 0, 'hit_time': 0.0, 'miss_time': 0.0, 'writes': 0, 'evictions': 0}
+_DECODE_CACHE_HEADER = struct.Struct('<4sII')  # signature, largeur, hauteur
+_DECODE_CACHE_MAGIC = b'VRGB'
+
+def asset_cache_enable(directory: str = ".vivi_cache", max_bytes: int = 256 * 1024 * 1024):
+    """
+    Active le cache disque des images décodées : au lancement suivant, les images
+    inchangées sont relues en pixels bruts au lieu d'être décodées (PNG, JPEG...).
+    Une entrée est identifiée par le chemin, la date de modification et la taille du fichier.
+    
+    Args:
+        directory: Dossier du cache (créé si nécessaire)
+        max_bytes: Taille maximale du cache ; les entrées les moins récemment utilisées sont supprimées
+    """
+    global _decode_cache_dir, _decode_cache_max_bytes, _decode_cache_bytes
+    os.makedirs(directory, exist_ok=True)
+    with _decode_cache_lock:
+        _decode_cache_dir = os.path.abspath(directory)
+        _decode_cache_max_bytes = max_bytes
+        _decode_cache_bytes = sum(size for _, size, _ in _decode_cache_entries())
+        _decode_cache_trim()
+
+def asset_cache_disable():
+    """Désactive le cache disque des images décodées (les fichiers sont conservés)."""
+    global _decode_cache_dir
+    with _decode_cache_lock:
+        _decode_cache_dir = None
+
+def asset_cache_clear():
+    """Supprime toutes les entrées du cache disque des images décodées."""
+    global _decode_cache_bytes
+    with _decode_cache_lock:
+        for path, _, _ in _decode_cache_entries():
+            _remove_file(path)
+        _decode_cache_bytes = 0
+
+def asset_cache_get_report() -> Dict[str, Any]:
+    """
+    Retourne l'état du cache disque et les temps de chargement des images,
+    décodées (lancement à froid) ou relues depuis le cache (lancement à chaud).
+    
+    Returns:
+        Dictionnaire (enabled, hits, misses, hit_time, miss_time, hit_avg_ms, miss_avg_ms,
+        speedup, writes, evictions, bytes, max_bytes)
+    """
+    with _decode_cache_lock:
+        stats = dict(_decode_cache_stats)
+        stats['bytes'] = _decode_cache_bytes
+    stats['enabled'] = _decode_cache_dir is not None
+    stats['max_bytes'] = _decode_cache_max_bytes
+    stats['hit_avg_ms'] = stats['hit_time'] * 1000 / stats['hits'] if stats['hits'] else 0.0
+    stats['miss_avg_ms'] = stats['miss_time'] * 1000 / stats['misses'] if stats['misses'] else 0.0
+    stats['speedup'] = stats['miss_avg_ms'] / stats['hit_avg_ms'] if stats['hit_avg_ms'] and stats['miss_avg_ms'] else 0.0
+    return stats
+
+def _decode_cache_entries() -> List[Tuple[str, int, float]]:
+    """Liste les entrées du cache : (chemin, taille, date de dernier usage)."""
+    entries = []
+    with os.scandir(_decode_cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.rgba'):
+                try:
+                    info = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, info.st_size, info.st_mtime))
+    return entries
+
+def _decode_cache_trim():
+    """Supprime les entrées les moins récemment utilisées au-delà de la taille maximale (verrou tenu)."""
+    global _decode_cache_bytes
+    if _decode_cache_bytes <= _decode_cache_max_bytes:
+        return
+    entries = sorted(_decode_cache_entries(), key=lambda entry: entry[2])
+    _decode_cache_bytes = sum(size for _, size, _ in entries)
+    for path, size, _ in entries:
+        if _decode_cache_bytes <= _decode_cache_max_bytes:
+            break
+        if _remove_file(path):
+            _decode_cache_bytes -= size
+            _decode_cache_stats['evictions'] += 1
+
+def _remove_file(path: str) -> bool:
+    """Supprime un fichier en ignorant les erreurs (fichier déjà supprimé...)."""
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+def _decode_cache_path(filepath: str) -> Optional[str]:
+    """Retourne le fichier de cache correspondant à l'état actuel d'une image."""
+    try:
+        info = os.stat(filepath)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(filepath)}|{info.st_mtime_ns}|{info.st_size}"
+    return os.path.join(_decode_cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.rgba')
+
+def _decode_cache_read(cache_path: str) -> Optional[pygame.Surface]:
+    """Relit une image depuis le cache, ou None si l'entrée est absente ou invalide."""
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    if len(data) >= _DECODE_CACHE_HEADER.size:
+        magic, width, height = _DECODE_CACHE_HEADER.unpack_from(data)
+        if magic == _DECODE_CACHE_MAGIC and len(data) == _DECODE_CACHE_HEADER.size + width * height * 4:
+            try:
+                os.utime(cache_path)  # Date de dernier usage pour l'éviction
+            except OSError:
+                pass
+            return pygame.image.frombuffer(memoryview(data)[_DECODE_CACHE_HEADER.size:], (width, height), 'RGBA')
+    # Entrée tronquée ou corrompue
+    _remove_file(cache_path)
+    return None
+
+def _decode_cache_write(cache_path: str, surface: pygame.Surface):
+    """Écrit une image décodée dans le cache (écriture atomique)."""
+    global _decode_cache_bytes
+    data = pygame.image.tobytes(surface, 'RGBA')
+    header = _DECODE_CACHE_HEADER.pack(_DECODE_CACHE_MAGIC, surface.get_width(), surface.get_height())
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(header)
+            file.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        _remove_file(temp_path)
+        print(f"Warning: cache d'images non écrit ({e})")
+        return
+    with _decode_cache_lock:
+        _decode_cache_bytes += len(header) + len(data)
+        _decode_cache_stats['writes'] += 1
+        _decode_cache_trim()
+
+def _decode_image(filepath: str) -> pygame.Surface:
+    """Décode un fichier image (peut être appelé depuis un thread)."""
+    if _decode_cache_dir is None:
+        return pygame.image.load(filepath)
+    
+    start = time.perf_counter()
+    cache_path = _decode_cache_path(filepath)
+    surface = _decode_cache_read(cache_path) if cache_path else None
+    if surface is not None:
+        with _decode_cache_lock:
+            _decode_cache_stats['hits'] += 1
+            _decode_cache_stats['hit_time'] += time.perf_counter() - start
+        return surface
+    
+    surface = pygame.image.load(filepath)
+    if cache_path:
+        _decode_cache_write(cache_path, surface)
+    with _decode_cache_lock:
+        _decode_cache_stats['misses'] += 1
+        _decode_cache_stats['miss_time'] += time.perf_counter() - start
+    return surface
+
+# Couleurs transparentes essayées pour les images à alpha binaire (la première absente de l'image est utilisée)
+_COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253))
+
+def _prepare_image(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convertit une image décodée au format d'affichage le plus rapide à dessiner (thread principal uniquement) :
+    sans alpha si elle est opaque, avec une couleur transparente accélérée (RLE) si son alpha
+    est binaire, et avec un alpha par pixel seulement si elle a des pixels semi-transparents.
+    """
+    alpha = _classify_alpha(surface)
+    if alpha == 'opaque':
+        return surface.convert()
+    
+    if alpha == 'binary':
+        opaque = pygame.mask.from_surface(surface, 127)
+        converted = surface.convert()
+        for key in _COLORKEY_CANDIDATES:
+            # La couleur transparente ne doit colorer aucun pixel opaque
+            if pygame.mask.from_threshold(converted, key, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+                continue
+            opaque.invert()
+            opaque.to_surface(converted, setcolor=key, unsetcolor=None)
+            converted.set_colorkey(key, pygame.RLEACCEL)
+            return converted
+    
+    return surface.convert_alpha()
+
+def _classify_alpha(surface: pygame.Surface) -> str:
+    """
+    Classe une image selon sa transparence.
+    
+    Returns:
+        'opaque' (aucun pixel transparent), 'binary' (pixels opaques ou invisibles)
+        ou 'soft' (au moins un pixel semi-transparent)
+    """
+    total = surface.get_width() * surface.get_height()
+    if surface.get_flags() & pygame.SRCALPHA:
+        opaque = pygame.mask.from_surface(surface, 254).count()
+        if opaque == total:
+            return 'opaque'
+        return 'binary' if pygame.mask.from_surface(surface, 0).count() == opaque else 'soft'
+    if surface.get_colorkey() is not None:
+        return 'binary' if pygame.mask.from_surface(surface).count() < total else 'opaque'
+    return 'opaque'
+
+def sprite_get_alpha_report() -> Dict[str, Any]:
+    """
+    Retourne le nombre d'images des sprites chargés par classe de transparence.
+    Une planche est convertie d'un bloc : elle prend la classe la plus coûteuse de ses images.
+    
+    Returns:
+        Dictionnaire (opaque, binary, soft : nombre d'images de chaque classe ;
+        sheets : nombre de planches dessinées sans alpha, avec couleur transparente et avec alpha par pixel)
+    """
+    report = {'opaque': 0, 'binary': 0, 'soft': 0,
+              'sheets': {'opaque': 0, 'binary': 0, 'soft': 0}}
+    for sprite in _sprites.values():
+        if sprite.full_surface is None:
+            continue
+        surface = sprite.full_surface
+        if surface.get_colorkey() is not None:
+            report['sheets']['binary'] += 1
+        elif surface.get_flags() & pygame.SRCALPHA:
+            report['sheets']['soft'] += 1
+        else:
+            report['sheets']['opaque'] += 1
+        for image in sprite.images:
+            report[_classify_alpha(image)] += 1
+    return report
+
+def load_sound(filepath: str, name: Optional[str] = None, lazy: bool = False) -> bool:
     """
     Charge un son depuis un fichier.
     
     Args:
         filepath: Chemin vers le fichier audio
         name: Nom du son (optionnel, utilise le nom du fichier par défaut)
+        lazy: Si True, seul le chemin est enregistré ; le son est décodé au premier
+              get_sound() et peut être libéré selon le budget mémoire (voir asset_set_budget)
     
     Returns:
         True si le chargement a réussi
@@ -119,7 +520,13 @@ def load_sound(filepath: str, name: Optional[str] = None) -> bool:
         if name is None:
             name = os.path.splitext(os.path.basename(filepath))[0]
         
+        if lazy:
+            _register_lazy_sound(name, filepath)
+            print(f"Son '{name}' enregistré (chargement à la demande)")
+            return True
+        
         sound = pygame.mixer.Sound(filepath)
+        _asset_forget('sound', name)
         _sounds[name] = sound
         
         print(f"Son '{name}' chargé")
@@ -129,14 +536,17 @@ def load_sound(filepath: str, name: Optional[str] = None) -> bool:
         print(f"Erreur lors du chargement du son '{filepath}': {e}")
         return False
 
-def load_font(filepath: str, size: int = 24, name: Optional[str] = None) -> bool:
+def load_font(filepath: str, size: int = 24, name: Optional[str] = None, sizes: Optional[List[int]] = None) -> bool:
     """
     Charge une police depuis un fichier.
+    La police est enregistrée comme une famille : les autres tailles sont créées
+    à la demande (draw_text avec scale) et gardées en cache.
     
     Args:
         filepath: Chemin vers le fichier de police
-        size: Taille de la police
+        size: Taille de la police (taille utilisée par draw_text avec scale=1)
         name: Nom de la police (optionnel, utilise le nom du fichier par défaut)
+        sizes: Tailles supplémentaires à créer dès maintenant (optionnel)
     
     Returns:
         True si le chargement a réussi
@@ -145,8 +555,9 @@ def load_font(filepath: str, size: int = 24, name: Optional[str] = None) -> bool
         if name is None:
             name = os.path.splitext(os.path.basename(filepath))[0]
         
-        font = pygame.font.Font(filepath, size)
-        _fonts[name] = font
+        _register_font_family(name, filepath, size)
+        for extra_size in sizes or ():
+            _get_font_size(name, extra_size)
         
         print(f"Police '{name}' chargée (taille {size})")
         return True
@@ -156,16 +567,88 @@ def load_font(filepath: str, size: int = 24, name: Optional[str] = None) -> bool
         return False
 
 def get_sprite(name: str) -> Optional[Sprite]:
-    """Retourne le sprite avec le nom donné."""
-    return _sprites.get(name)
+    """Retourne le sprite avec le nom donné (chargé si nécessaire)."""
+    sprite = _sprites.get(name)
+    if sprite is not None and sprite.path is not None:
+        _asset_use('sprite', name)
+    return sprite
+
+def sprite_get_handle(name: str) -> int:
+    """
+    Retourne l'identifiant entier d'un sprite, pour le retrouver sans recherche par nom.
+    L'identifiant est stable : il reste valide si le sprite est rechargé, et peut
+    être demandé avant le chargement du sprite.
+    
+    Args:
+        name: Nom du sprite
+    
+    Returns:
+        Identifiant du sprite (voir get_sprite_by_handle)
+    """
+    handle = _sprite_handles.get(name)
+    if handle is None:
+        handle = _sprite_handles[name] = len(_sprite_list)
+        _sprite_list.append(_sprites.get(name))
+    return handle
+
+def get_sprite_by_handle(handle: int) -> Optional[Sprite]:
+    """Retourne le sprite correspondant à un identifiant (chargé si nécessaire)."""
+    sprite = _sprite_list[handle] if 0 <= handle < len(_sprite_list) else None
+    if sprite is not None and sprite.path is not None:
+        _asset_use('sprite', sprite.name)
+    return sprite
+
+def _get_sprite_info(handle: int) -> Optional[Sprite]:
+    """Retourne le sprite d'un identifiant sans le charger (dimensions, centre et nombre d'images seulement)."""
+    return _sprite_list[handle] if 0 <= handle < len(_sprite_list) else None
+
+def _register_sprite(name: str, sprite: Sprite) -> Sprite:
+    """Enregistre un sprite sous un nom (en conservant l'identifiant d'un sprite remplacé)."""
+    _sprites[name] = sprite
+    _sprite_list[sprite_get_handle(name)] = sprite
+    return sprite
 
 def get_sound(name: str) -> Optional[pygame.mixer.Sound]:
-    """Retourne le son avec le nom donné."""
+    """Retourne le son avec le nom donné (chargé si nécessaire)."""
+    if name in _lazy_sounds:
+        _asset_use('sound', name)
     return _sounds.get(name)
 
-def get_font(name: str) -> Optional[pygame.font.Font]:
-    """Retourne la police avec le nom donné."""
-    return _fonts.get(name)
+def get_font(name: str, size: Optional[int] = None) -> Optional[pygame.font.Font]:
+    """
+    Retourne la police avec le nom donné.
+    
+    Args:
+        name: Nom de la police
+        size: Taille voulue (optionnel, taille de chargement par défaut)
+    """
+    if size is None or name not in _font_families:
+        return _fonts.get(name)
+    return _get_font_size(name, size)
+
+def _register_font_family(name: str, filepath: str, size: int):
+    """Enregistre une famille de polices et crée sa taille de base."""
+    for key in [key for key in _font_cache if key[0] == name]:
+        del _font_cache[key]
+    _font_families[name] = (filepath, size)
+    _fonts[name] = _get_font_size(name, size)
+
+def _get_font_size(name: Optional[str], size: int) -> pygame.font.Font:
+    """Retourne une police d'une famille (None pour la police par défaut) à une taille, depuis le cache."""
+    key = (name, size)
+    font = _font_cache.get(key)
+    if font is not None:
+        _font_cache.move_to_end(key)
+        return font
+    
+    font = _font_cache[key] = pygame.font.Font(_font_families[name][0] if name else None, size)
+    if len(_font_cache) > _FONT_CACHE_MAX:
+        # Ne jamais retirer les tailles de base, utilisées par get_font()
+        for old_key in list(_font_cache):
+            if old_key[0] is None or _font_families[old_key[0]][1] != old_key[1]:
+                del _font_cache[old_key]
+                break
+    return font
 
 def sprite_set_center(name: str, x: int, y: int) -> bool:
     """
@@ -179,12 +662,345 @@ def sprite_set_center(name: str, x: int, y: int) -> bool:
     Returns:
         True si le sprite existe et que le centre a été défini
     """
-    sprite = get_sprite(name)
+    sprite = _sprites.get(name)  # Le centre ne nécessite pas de charger les pixels
     if sprite:
         sprite.set_center(x, y)
         return True
     return False
 
+def sprite_set_sheet(name: str, columns: int, rows: int = 1, image_count: Optional[int] = None,
+                     padding: int = 0, margin: int = 0) -> bool:
+    """
+    Découpe un sprite en grille (planche de plusieurs lignes, avec espacement et bordure).
+    Les images restent des sous-surfaces de la planche, sans copie.
+    
+    Args:
+        name: Nom du sprite
+        columns: Nombre de colonnes
+        rows: Nombre de lignes
+        image_count: Nombre d'images (columns * rows par défaut)
+        padding: Espace entre deux images en pixels
+        margin: Bordure autour de la grille en pixels
+    
+    Returns:
+        True si le sprite existe et que la grille a été appliquée
+    """
+    sprite = _sprites.get(name)
+    if sprite:
+        sprite.set_sheet(columns, rows, image_count, padding, margin,
+                         sprite.frame_origins, sprite.frame_durations)
+        return True
+    return False
+
+# Chargement à la demande (voir asset_set_budget)
+_asset_budget: Optional[int] = None  # None = pas de limite
+_asset_resident: 'OrderedDict[Tuple[str, str], int]' = OrderedDict()  # (type, nom) -> octets, du moins récent au plus récent
+_asset_pins: Dict[Tuple[str, str], int] = {}
+_lazy_sounds: Dict[str, str] = {}  # nom -> chemin
+_asset_failed: set = set()  # (type, nom) dont le décodage a échoué : pas de nouvel essai avant rechargement
+_asset_loads = 0
+_asset_evictions = 0
+
+def _register_lazy_sprite(name: str, filepath: str) -> Sprite:
+    """
+    Enregistre un sprite dont l'image sera décodée au premier usage.
+    Ses dimensions sont lues dès maintenant : le culling et les masques n'ont pas à le charger.
+    """
+    _asset_forget('sprite', name)
+    sprite = _create_sprite(name, filepath, lazy=True)
+    size = _read_image_size(filepath)
+    if size is None:
+        size = _decode_image(filepath).get_size()  # Format inconnu : décoder une fois
+    sprite._set_sheet_size(*size)
+    return _register_sprite(name, sprite)
+
+def _read_image_size(filepath: str) -> Optional[Tuple[int, int]]:
+    """Lit la taille d'une image PNG, GIF, BMP ou JPEG dans son en-tête, sans la décoder."""
+    try:
+        with open(filepath, 'rb') as file:
+            header = file.read(26)
+            if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+                return struct.unpack('>II', header[16:24])
+            if header[:6] in (b'GIF87a', b'GIF89a'):
+                return struct.unpack('<HH', header[6:10])
+            if header[:2] == b'BM' and len(header) >= 26:
+                width, height = struct.unpack('<ii', header[18:26])
+                return width, abs(height)
+            if header[:2] == b'\xff\xd8':
+                # Parcourir les segments jusqu'à l'en-tête de trame (SOF)
+                file.seek(2)
+                while True:
+                    marker = file.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+                    length = struct.unpack('>H', file.read(2))[0]
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        height, width = struct.unpack('>xHH', file.read(5))
+                        return width, height
+                    file.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        pass
+    return None
+
+def _register_lazy_sound(name: str, filepath: str):
+    """Enregistre un son qui sera décodé au premier usage."""
+    _asset_forget('sound', name)
+    _sounds.pop(name, None)
+    _lazy_sounds[name] = filepath
+
+def _asset_forget(kind: str, name: str):
+    """Oublie l'état à la demande d'un asset sur le point d'être remplacé."""
+    _asset_resident.pop((kind, name), None)
+    _asset_failed.discard((kind, name))
+    if kind == 'sound':
+        _lazy_sounds.pop(name, None)
+
+def _asset_use(kind: str, name: str):
+    """Marque un asset à la demande comme récemment utilisé, en le chargeant si besoin."""
+    global _asset_loads
+    key = (kind, name)
+    if key in _asset_resident:
+        _asset_resident.move_to_end(key)
+        return
+    if key in _asset_failed:
+        return  # Déjà signalé : ne pas redécoder à chaque frame
+    
+    try:
+        if kind == 'sprite':
+            sprite = _sprites[name]
+            sprite._set_surface(_prepare_image(_decode_image(sprite.path)))
+            size = _sprite_bytes(sprite)
+        else:
+            sound = pygame.mixer.Sound(_lazy_sounds[name])
+            _sounds[name] = sound
+            size = _sound_bytes(sound)
+    except (pygame.error, OSError) as e:
+        print(f"Erreur lors du chargement de '{name}': {e}")
+        _asset_failed.add(key)
+        return
+    
+    _asset_resident[key] = size
+    _asset_loads += 1
+    _asset_evict()
+
+def _sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Estime la mémoire occupée par un son décodé."""
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, size, channels = mixer
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+def _asset_release(kind: str, name: str):
+    """Libère les données d'un asset à la demande (il reste enregistré)."""
+    global _asset_evictions
+    if _asset_resident.pop((kind, name), None) is None:
+        return
+    _asset_evictions += 1
+    if kind == 'sprite':
+        sprite = _sprites[name]
+        _transform_cache.discard(lambda key: key[0] is sprite)
+        sprite._unload()
+    else:
+        _sounds.pop(name, None)
+
+def _asset_evict():
+    """Libère les assets les moins récemment utilisés et non épinglés jusqu'à respecter le budget."""
+    if _asset_budget is None:
+        return
+    resident = sum(_asset_resident.values())
+    # Ne jamais libérer l'asset le plus récent (celui qu'on vient d'utiliser)
+    for key in list(_asset_resident)[:-1]:
+        if resident <= _asset_budget:
+            break
+        if key not in _asset_pins:
+            resident -= _asset_resident[key]
+            _asset_release(*key)
+
+def asset_set_budget(max_bytes: Optional[int]):
+    """
+    Définit la mémoire maximale des assets chargés à la demande (lazy=True).
+    Au-delà, les moins récemment utilisés sont libérés puis rechargés au besoin.
+    
+    Args:
+        max_bytes: Budget en octets (None pour aucune limite)
+    """
+    global _asset_budget
+    _asset_budget = max_bytes
+    _asset_evict()
+
+def asset_pin(name: str):
+    """
+    Épingle un asset à la demande : il est chargé immédiatement et n'est jamais libéré.
+    
+    Args:
+        name: Nom du sprite ou du son
+    """
+    for kind, registered in (('sprite', name in _sprites and _sprites[name].path is not None),
+                             ('sound', name in _lazy_sounds)):
+        if registered:
+            _asset_pins[(kind, name)] = _asset_pins.get((kind, name), 0) + 1
+            _asset_use(kind, name)
+
+def asset_unpin(name: str):
+    """
+    Retire un épinglage posé par asset_pin().
+    
+    Args:
+        name: Nom du sprite ou du son
+    """
+    for kind in ('sprite', 'sound'):
+        key = (kind, name)
+        if key in _asset_pins:
+            _asset_pins[key] -= 1
+            if _asset_pins[key] <= 0:
+                del _asset_pins[key]
+    _asset_evict()
+
+def asset_get_stats() -> Dict[str, Any]:
+    """
+    Retourne l'état de la mémoire des assets chargés à la demande.
+    
+    Returns:
+        Dictionnaire (registered, resident, resident_bytes, budget, pinned, loads, evictions)
+    """
+    registered = sum(1 for sprite in _sprites.values() if sprite.path is not None)
+    return {
+        'registered': registered + len(_lazy_sounds),
+        'resident': len(_asset_resident),
+        'resident_bytes': sum(_asset_resident.values()),
+        'budget': _asset_budget,
+        'pinned': len(_asset_pins),
+        'loads': _asset_loads,
+        'evictions': _asset_evictions,
+    }
+
+# Atlas de textures (voir atlas_build)
+_atlas: Optional[TextureAtlas] = None
+_atlas_report: Dict[str, Any] = {}
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Retourne la mémoire occupée par les pixels d'une surface (0 pour une sous-surface)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+def _sprite_bytes(sprite: Sprite) -> int:
+    """Retourne la mémoire occupée par les pixels propres d'un sprite."""
+    return _surface_bytes(sprite.full_surface) + sum(_surface_bytes(image) for image in sprite.images)
+
+def atlas_build(page_size: int = 2048, padding: int = 0) -> Dict[str, Any]:
+    """
+    Regroupe les images de tous les sprites chargés dans des atlas de textures.
+    Les images des sprites deviennent des sous-surfaces des pages de l'atlas (sans copie).
+    À rappeler après avoir chargé de nouveaux sprites.
+    
+    Args:
+        page_size: Largeur et hauteur maximale d'une page en pixels
+        padding: Espace laissé entre deux sprites
+    
+    Returns:
+        Rapport d'occupation (voir atlas_get_report)
+    """
+    global _atlas, _atlas_report
+    # Les sprites à la demande peuvent être libérés : ils restent hors de l'atlas,
+    # comme les sprites sans alpha par pixel (déjà plus rapides à dessiner dans leur propre format)
+    sprites = [sprite for sprite in _sprites.values()
+               if sprite.path is None and sprite.full_surface is not None
+               and sprite.full_surface.get_flags() & pygame.SRCALPHA]
+    bytes_before = sum(_sprite_bytes(sprite) for sprite in sprites)
+    if _atlas is not None:
+        bytes_before += _atlas.get_bytes()
+    
+    # Chaque planche est rangée d'un bloc : ses images restent contiguës
+    atlas = TextureAtlas(page_size, padding)
+    placements = atlas.pack([sprite.full_surface for sprite in sprites])
+    
+    packed_sprites = packed_frames = 0
+    for sprite, placement in zip(sprites, placements):
+        if placement is not None:
+            sprite._set_surface(atlas.get_region(*placement), copy=False)
+            packed_sprites += 1
+            packed_frames += len(sprite.images)
+    
+    bytes_after = atlas.get_bytes() + sum(_sprite_bytes(sprite) for sprite in sprites)
+    _atlas = atlas
+    _atlas_report = atlas.get_report()
+    _atlas_report.update({
+        'sprites': packed_sprites,
+        'frames': packed_frames,
+        'skipped': len(sprites) - packed_sprites,
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+        'bytes_saved': bytes_before - bytes_after,
+    })
+    return dict(_atlas_report)
+
+def atlas_get_report() -> Dict[str, Any]:
+    """
+    Retourne le rapport du dernier atlas construit.
+    
+    Returns:
+        Dictionnaire (pages, page_sizes, bytes, occupancy, sprites, frames,
+        skipped, bytes_before, bytes_after, bytes_saved)
+    """
+    return dict(_atlas_report)
+
+# Archives de sprites pré-décodés (voir archive_build)
+_archives: List[AssetArchive] = []
+
+def archive_build(filepath: str, names: Optional[List[str]] = None) -> int:
+    """
+    Écrit les sprites chargés dans une archive de pixels bruts, rechargeable
+    instantanément avec archive_load() (étape de build, pour éviter le décodage des PNG au lancement).
+    
+    Args:
+        filepath: Chemin de l'archive à écrire
+        names: Noms des sprites à inclure (tous les sprites par défaut)
+    
+    Returns:
+        Taille de l'archive en octets
+    """
+    entries = []
+    for name in (names if names is not None else list(_sprites)):
+        sprite = get_sprite(name)
+        if sprite is not None and sprite.full_surface is not None:
+            entries.append((name, sprite.full_surface, sprite._get_sheet()))
+    size = write_archive(filepath, entries)
+    print(f"Archive '{filepath}' écrite : {len(entries)} sprite(s), {size} octets")
+    return size
+
+def archive_load(filepath: str) -> bool:
+    """
+    Charge tous les sprites d'une archive écrite par archive_build().
+    Le fichier est mappé en mémoire : les pixels ne sont pas décodés, et ceux des sprites
+    avec alpha par pixel ne sont pas copiés (les autres retrouvent leur format sans alpha
+    ou à couleur transparente, voir sprite_get_alpha_report).
+    
+    Args:
+        filepath: Chemin de l'archive
+    
+    Returns:
+        True si le chargement a réussi
+    """
+    try:
+        archive = AssetArchive(filepath)
+    except (OSError, ValueError) as e:
+        print(f"Erreur lors du chargement de l'archive {filepath}: {e}")
+        return False
+    
+    for name, entry in archive.entries.items():
+        sprite = Sprite(None, name)
+        sprite._apply_sheet(entry['sheet'])
+        # Images en sous-surfaces de la surface de l'archive
+        sprite._set_surface(archive.get_surface(name))
+        _asset_forget('sprite', name)
+        _register_sprite(name, sprite)
+    _archives.append(archive)
+    
+    print(f"Archive '{filepath}' chargée : {len(archive.entries)} sprite(s)")
+    return True
+
 _draw_color = (255, 255, 255)
 _draw_alpha = 1.0
 
@@ -243,20 +1059,116 @@ def draw_get_valign() -> int:
 _game_instance = None
 _screen = None
 _clock = None
-
-# Stockage des assets
-_sprites: Dict[str, pygame.Surface] = {}
-_sounds: Dict[str, pygame.mixer.Sound] = {}
-_fonts: Dict[str, pygame.font.Font] = {}
+_frame_count = 0  # Numéro de la frame en cours, avancé par Game.run (0 hors de la boucle de jeu)
 
 # État du rendu
 _current_surface = None
 _render_color = (255, 255, 255)
 _render_alpha = 255
 
+class _SurfaceCache:
+    """Cache LRU de surfaces avec un budget mémoire en octets."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Any, Tuple[pygame.Surface, int]]' = OrderedDict()
+
+    def get(self, key) -> Optional[pygame.Surface]:
+        """Retourne la surface associée à la clé (et la marque comme récente)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface: pygame.Surface):
+        """Ajoute une surface au cache puis évince les plus anciennes si besoin."""
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.max_bytes:
+            return  # Trop grosse pour le budget, on ne la garde pas
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._entries[key] = (surface, size)
+        self.bytes += size
+        self._evict()
+
+    def remove(self, key):
+        """Retire une entrée du cache si elle existe."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def discard(self, predicate: Callable[[Any], bool]):
+        """Retire les entrées dont la clé vérifie le prédicat."""
+        for key in [key for key in self._entries if predicate(key)]:
+            self.bytes -= self._entries.pop(key)[1]
+    
+    def set_max_bytes(self, max_bytes: int):
+        """Change le budget mémoire."""
+        self.max_bytes = max(0, int(max_bytes))
+        self._evict()
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro."""
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+# File d'attente du rendu par lots (voir Scene.batch_rendering)
+_blit_batching = False
+_blit_queue: List[Tuple[pygame.Surface, Tuple[float, float]]] = []
+_blit_queue_target = None
+
+# Présentation par rectangles modifiés (voir display_set_dirty_rects)
+_dirty_rects_enabled = False
+_dirty_rects_threshold = 0.5
+_dirty_full = True
+_dirty_current: Dict[Any, pygame.Rect] = {}
+_dirty_previous: Dict[Any, pygame.Rect] = {}
+_dirty_clear_colors: Dict[pygame.Surface, Any] = {}
+_dirty_camera_states: Dict[int, Tuple] = {}
+
+# Cache des images transformées (échelle, miroir, rotation, teinte)
+_transform_cache = _SurfaceCache(32 * 1024 * 1024)
+_transform_angle_step = 1.0
+
+# Cache des polices par (famille, taille) et des textes rendus
+_font_cache: 'OrderedDict[Tuple[Optional[str], int], pygame.font.Font]' = OrderedDict()
+_FONT_CACHE_MAX = 64
+_text_cache = _SurfaceCache(4 * 1024 * 1024)
+
 # Gestion de la caméra
 _cameras: Dict[int, Dict[str, Any]] = {}
 _camera_surfaces: Dict[int, pygame.Surface] = {}
+_camera_port_surfaces: Dict[int, pygame.Surface] = {}  # Surfaces préallouées pour la mise à l'échelle
 _active_camera = None
 _next_camera_id = 0
 
@@ -270,66 +1182,233 @@ _mouse_released = set()
 _mouse_x = 0
 _mouse_y = 0
 
-def load_assets(assets_folder: str = "assets"):
+def load_assets(assets_folder: str = "assets", workers: Optional[int] = None,
+                progress: Optional[Callable[[int, int, str], None]] = None, lazy: bool = False):
     """
     Charge tous les assets depuis un dossier.
+    Les images et les sons sont décodés en parallèle par un groupe de threads ;
+    la conversion des images et l'enregistrement se font sur le thread principal.
+    Les fichiers du sous-dossier "music" (optionnel) sont lus en streaming (voir music_play).
     
     Args:
         assets_folder: Chemin vers le dossier des assets
+        workers: Nombre de threads de décodage (None pour une valeur automatique, 1 pour tout charger sur le thread principal)
+        progress: Fonction appelée sur le thread principal après chaque asset chargé,
+                  avec (nombre chargé, nombre total, nom de l'asset)
+        lazy: Si True, les images et les sons sont seulement enregistrés et décodés
+              au premier usage (voir asset_set_budget)
     """
     global _sprites, _sounds, _fonts
 
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    assets_path = os.path.join(base_path, assets_folder)
+    assets_path = _get_assets_path(assets_folder)
     
     if not os.path.exists(assets_path):
         print(f"Warning: Assets folder '{assets_path}' not found!")
         return
     
-    # Charger les images
-    images_folder = os.path.join(assets_path, "images")
-    if os.path.exists(images_folder):
-        for filename in os.listdir(images_folder):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-                name = os.path.splitext(filename)[0]
-                path = os.path.join(images_folder, filename)
-                try:
-                    _sprites[name] = pygame.image.load(path).convert_alpha()
-                    print(f"Loaded sprite: {name}")
-                except pygame.error as e:
-                    print(f"Error loading sprite {filename}: {e}")
-    else:
-        print(f"Warning: Assets folder '{images_folder}' not found!")
+    # Lister les fichiers à charger : (type, nom de fichier, chemin)
+    jobs = _list_asset_files(assets_path)
     
-    # Charger les sons
-    sounds_folder = os.path.join(assets_path, "sounds")
-    if os.path.exists(sounds_folder):
-        for filename in os.listdir(sounds_folder):
-            if filename.lower().endswith(('.wav', '.mp3', '.ogg')):
-                name = os.path.splitext(filename)[0]
-                path = os.path.join(sounds_folder, filename)
-                try:
-                    _sounds[name] = pygame.mixer.Sound(path)
-                    print(f"Loaded sound: {name}")
-                except pygame.error as e:
-                    print(f"Error loading sound {filename}: {e}")
-    else:
-        print(f"Warning: Assets folder '{sounds_folder}' not found!")
+    total = len(jobs)
+    done = 0
     
-    # Charger les polices
-    fonts_folder = os.path.join(assets_path, "fonts")
-    if os.path.exists(fonts_folder):
-        for filename in os.listdir(fonts_folder):
-            if filename.lower().endswith(('.ttf', '.otf')):
-                name = os.path.splitext(filename)[0]
-                path = os.path.join(fonts_folder, filename)
+    if lazy:
+        # Enregistrer les images et les sons sans les décoder
+        deferred = [job for job in jobs if job[0] in ('sprite', 'sound')]
+        jobs = [job for job in jobs if job[0] not in ('sprite', 'sound')]
+        for kind, filename, path in deferred:
+            if kind == 'sprite':
+                name, _ = _parse_sprite_filename(path)
                 try:
-                    _fonts[name] = pygame.font.Font(path, 24)  # Taille par défaut
-                    print(f"Loaded font: {name}")
-                except pygame.error as e:
-                    print(f"Error loading font {filename}: {e}")
+                    _register_lazy_sprite(name, path)
+                except (pygame.error, OSError) as e:
+                    print(f"Error loading {kind} {filename}: {e}")
+            else:
+                name = os.path.splitext(filename)[0]
+                _register_lazy_sound(name, path)
+            done += 1
+            if progress:
+                progress(done, total, name)
+    
+    def register(kind: str, filename: str, path: str, decode: Callable[[], Any]):
+        nonlocal done
+        name = os.path.splitext(filename)[0]
+        try:
+            data = decode()
+            if kind == 'sprite':
+                name, _ = _parse_sprite_filename(path)
+                _asset_forget(kind, name)
+                _register_sprite(name, _create_sprite(name, path, _prepare_image(data)))
+            elif kind == 'sound':
+                _asset_forget(kind, name)
+                _sounds[name] = data
+            elif kind == 'music':
+                _music[name] = path  # Lu en streaming par music_play()
+            else:
+                _register_font_family(name, path, 24)  # Taille par défaut
+            print(f"Loaded {kind}: {name}")
+        except pygame.error as e:
+            print(f"Error loading {kind} {filename}: {e}")
+        done += 1
+        if progress:
+            progress(done, total, name)
+    
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    
+    if workers > 1 and len(jobs) > 1:
+        # Décoder en parallèle (le décodage PNG/WAV relâche le GIL)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_decode_asset, kind, path): (kind, filename, path)
+                       for kind, filename, path in jobs}
+            for future in as_completed(futures):
+                register(*futures[future], future.result)
     else:
-        print(f"Warning: Assets folder '{fonts_folder}' not found!")
+        for kind, filename, path in jobs:
+            register(kind, filename, path, lambda: _decode_asset(kind, path))
+
+def _get_assets_path(assets_folder: str) -> str:
+    """Retourne le chemin d'un dossier d'assets (relatif au dossier du moteur)."""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, assets_folder)
+
+def _list_asset_files(assets_path: str, warn: bool = True) -> List[Tuple[str, str, str]]:
+    """Liste les fichiers d'assets d'un dossier : (type, nom de fichier, chemin)."""
+    files: List[Tuple[str, str, str]] = []
+    for kind, folder_name, extensions, required in (('sprite', "images", ('.png', '.jpg', '.jpeg', '.gif', '.bmp'), True),
+                                                    ('sound', "sounds", ('.wav', '.mp3', '.ogg'), True),
+                                                    ('music', "music", ('.ogg', '.mp3', '.wav', '.flac', '.mod', '.xm'), False),
+                                                    ('font', "fonts", ('.ttf', '.otf'), True)):
+        folder = os.path.join(assets_path, folder_name)
+        if os.path.exists(folder):
+            for filename in os.listdir(folder):
+                if filename.lower().endswith(extensions):
+                    files.append((kind, filename, os.path.join(folder, filename)))
+        elif warn and required:
+            print(f"Warning: Assets folder '{folder}' not found!")
+    return files
+
+def _decode_asset(kind: str, path: str):
+    """Décode une image ou un son (peut être appelé depuis un thread)."""
+    if kind == 'sprite':
+        return _decode_image(path)
+    if kind == 'sound':
+        return pygame.mixer.Sound(path)
+    return None  # Les polices sont créées sur le thread principal, les musiques lues en streaming
+
+# Rechargement à chaud des assets (voir asset_watch_start)
+_watch_thread: Optional[threading.Thread] = None
+_watch_stop = threading.Event()
+_watch_reloads: List[Tuple[str, str, Any]] = []  # (type, chemin, données décodées) à appliquer entre deux frames
+_watch_lock = threading.Lock()
+
+def asset_watch_start(assets_folder: str = "assets", interval: float = 0.5):
+    """
+    Surveille un dossier d'assets et recharge les images et les sons modifiés sans redémarrer.
+    Les fichiers sont vérifiés et décodés sur un thread ; les nouvelles versions remplacent
+    les anciennes entre deux frames, les entités utilisant un sprite modifié sont mises à jour.
+    
+    Args:
+        assets_folder: Dossier des assets (même convention que load_assets)
+        interval: Délai entre deux vérifications en secondes
+    """
+    global _watch_thread
+    asset_watch_stop()
+    assets_path = _get_assets_path(assets_folder)
+    
+    # État initial : seuls les changements ultérieurs sont rechargés
+    signatures = {path: _file_signature(path) for kind, _, path in _list_asset_files(assets_path, warn=False)
+                  if kind in ('sprite', 'sound')}
+    
+    _watch_stop.clear()
+    _watch_thread = threading.Thread(target=_watch_assets, args=(assets_path, interval, signatures),
+                                     name="ViviEngine asset watcher", daemon=True)
+    _watch_thread.start()
+
+def asset_watch_stop():
+    """Arrête la surveillance des assets démarrée par asset_watch_start()."""
+    global _watch_thread
+    if _watch_thread is not None:
+        _watch_stop.set()
+        _watch_thread.join()
+        _watch_thread = None
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Retourne (date de modification, taille) d'un fichier, ou None s'il n'existe plus."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+def _watch_assets(assets_path: str, interval: float, signatures: Dict[str, Optional[Tuple[int, int]]]):
+    """Boucle du thread de surveillance : décode les fichiers nouveaux ou modifiés."""
+    failed: Dict[str, Tuple[int, int]] = {}  # chemin -> signature dont le décodage a échoué
+    while not _watch_stop.wait(interval):
+        for kind, _, path in _list_asset_files(assets_path, warn=False):
+            if kind not in ('sprite', 'sound'):
+                continue
+            signature = _file_signature(path)
+            if signature is None or signatures.get(path) == signature or failed.get(path) == signature:
+                continue
+            try:
+                data = _decode_asset(kind, path)
+            except (pygame.error, OSError) as e:
+                # Fichier en cours d'écriture, remplacé (sauvegarde atomique) ou invalide :
+                # réessayer quand il change, sans répéter l'avertissement d'ici là
+                print(f"Warning: rechargement de '{path}' reporté: {e}")
+                failed[path] = signature
+                continue
+            failed.pop(path, None)
+            signatures[path] = signature
+            with _watch_lock:
+                _watch_reloads.append((kind, path, data))
+
+def _apply_asset_reloads():
+    """Remplace les assets rechargés par le thread de surveillance (thread principal, entre deux frames)."""
+    if not _watch_reloads:
+        return
+    with _watch_lock:
+        reloads = _watch_reloads[:]
+        _watch_reloads.clear()
+    
+    changed_sprites = set()
+    for kind, path, data in reloads:
+        if kind == 'sprite':
+            name, _ = _parse_sprite_filename(path)
+            _asset_failed.discard(('sprite', name))
+            sprite = _sprites.get(name)
+            if sprite is None:
+                _register_sprite(name, _create_sprite(name, path, _prepare_image(data)))
+            elif sprite.path is not None and ('sprite', name) not in _asset_resident:
+                sprite.path = path  # Sprite à la demande non chargé : décodé au prochain usage
+                _configure_sprite(sprite, path)
+                sprite._set_sheet_size(*data.get_size())
+            else:
+                # Remplacer les pixels en place : les références au sprite restent valides
+                _transform_cache.discard(lambda key: key[0] is sprite)
+                sprite.full_surface = None
+                _configure_sprite(sprite, path)
+                sprite._set_surface(_prepare_image(data))
+                if ('sprite', name) in _asset_resident:
+                    _asset_resident[('sprite', name)] = _sprite_bytes(sprite)
+            changed_sprites.add(name)
+        else:
+            name = os.path.splitext(os.path.basename(path))[0]
+            _asset_failed.discard(('sound', name))
+            if name in _lazy_sounds and ('sound', name) not in _asset_resident:
+                continue  # Son à la demande non chargé : relu au prochain usage
+            _sounds[name] = data
+        print(f"Reloaded {kind}: {name}")
+    
+    scene = _game_instance.current_scene if _game_instance else None
+    if changed_sprites and scene:
+        for entity in scene.entities:
+            if entity.sprite_index in changed_sprites:
+                entity._update_sprite_dimensions()
+        for tilemap in scene.tilemaps:
+            if tilemap.sprite_name in changed_sprites:
+                tilemap.invalidate()
 
 # Fonctions de rendu
 def draw_clear(color: Tuple[int, int, int]):
@@ -339,17 +1418,23 @@ def draw_clear(color: Tuple[int, int, int]):
     Args:
         color: Couleur RGB (r, g, b)
     """
+    _flush_blit_queue()
     surface = _current_surface or _screen
     if surface:
         surface.fill(color)
+        # Un changement de couleur de fond impose de tout réafficher
+        if _dirty_rects_enabled and _dirty_clear_colors.get(surface) != color:
+            _dirty_clear_colors[surface] = color
+            display_invalidate()
 
 def _begin_camera_render():
     """Commence le rendu vers la surface de la caméra active."""
     global _current_surface
     if _active_camera != None and _active_camera in _camera_surfaces:
         _current_surface = _camera_surfaces[_active_camera]
-        # Effacer la surface de la caméra
-        _current_surface.fill((0, 0, 0, 0))  # Transparent par défaut)
+        # Effacer la surface de la caméra (une caméra opaque est effacée par draw_clear)
+        if _cameras[_active_camera]['transparent']:
+            _current_surface.fill((0, 0, 0, 0))
 
 def _end_camera_render():
     """Termine le rendu de caméra et affiche le résultat sur l'écran."""
@@ -359,6 +1444,9 @@ def _end_camera_render():
         cam = _cameras[_active_camera]
         camera_surface = _camera_surfaces[_active_camera]
         
+        # Envoyer les sprites en attente avant d'utiliser la surface
+        _flush_blit_queue()
+        
         # Remettre l'écran comme cible
         _current_surface = None
         
@@ -368,29 +1456,71 @@ def _end_camera_render():
         port_width = cam['port_width']
         port_height = cam['port_height']
         
+        port_pos = (cam['port_x'], cam['port_y'])
+        port_rect = pygame.Rect(port_pos, (port_width, port_height))
+        if _dirty_rects_enabled:
+            _dirty_check_camera(_active_camera, cam)
+        
         # Redimensionner la surface de caméra pour le viewport
         if view_width != port_width or view_height != port_height:
-            scaled_surface = pygame.transform.scale(camera_surface, (port_width, port_height))
+            if not cam['transparent'] and _screen.get_rect().contains(port_rect):
+                # Chemin rapide : mise à l'échelle directement dans l'écran, sans surface intermédiaire
+                try:
+                    pygame.transform.scale(camera_surface, port_rect.size, _screen.subsurface(port_rect))
+                    return
+                except ValueError:
+                    pass  # Formats différents : passer par la surface préallouée
+            scaled_surface = _camera_port_surfaces.get(_active_camera)
+            if scaled_surface is None or scaled_surface.get_size() != port_rect.size:
+                scaled_surface = pygame.Surface(port_rect.size, camera_surface.get_flags() & pygame.SRCALPHA, camera_surface)
+                _camera_port_surfaces[_active_camera] = scaled_surface
+            pygame.transform.scale(camera_surface, port_rect.size, scaled_surface)
         else:
             scaled_surface = camera_surface
         
         # Dessiner sur l'écran au bon endroit
-        _screen.blit(scaled_surface, (cam['port_x'], cam['port_y']))
+        if _dirty_rects_enabled and not _dirty_full:
+            # Ne recopier que les zones modifiées du viewport
+            for rect in _dirty_changed_rects():
+                rect = rect.clip(port_rect)
+                if rect.width and rect.height:
+                    _screen.blit(scaled_surface, rect.topleft, rect.move(-port_pos[0], -port_pos[1]))
+        else:
+            _screen.blit(scaled_surface, port_pos)
 
-def draw_sprite(x: float, y: float, name: str, image_index: int, xscale: float = 1.0, yscale: float = 1.0, angle: float = 0.0):
+def _get_view_rect() -> Optional[Tuple[float, float, float, float]]:
+    """
+    Retourne la zone du monde visible sur la cible de rendu courante.
+    
+    Returns:
+        Tuple (x, y, largeur, hauteur), ou None si aucune cible n'est disponible
+    """
+    if _active_camera != None and _active_camera in _cameras:
+        cam = _cameras[_active_camera]
+        return (cam['view_x'], cam['view_y'], cam['view_width'], cam['view_height'])
+    surface = _current_surface or _screen
+    if surface:
+        return (0, 0, surface.get_width(), surface.get_height())
+    return None
+
+def draw_sprite(x: float, y: float, name: Union[str, int], image_index: int, xscale: float = 1.0, yscale: float = 1.0, angle: float = 0.0):
     """
     Dessine un sprite à la position donnée.
     
     Args:
         x, y: Position de dessin
-        name: Nom du sprite
+        name: Nom du sprite, ou son identifiant (voir sprite_get_handle)
         image_index: Index de l'image à dessiner (pour les sprites multi-images)
         xscale, yscale: Facteurs d'échelle
         angle: Angle de rotation en degrés
     """
-    sprite = get_sprite(name)
-    if not sprite:
-        return
+    sprite = get_sprite_by_handle(name) if isinstance(name, int) else get_sprite(name)
+    _draw_sprite(x, y, sprite, image_index, xscale, yscale, angle, _draw_color)
+
+def _draw_sprite(x: float, y: float, sprite: Optional[Sprite], image_index: int, xscale: float, yscale: float, angle: float, color):
+    """Dessine un sprite déjà résolu avec une couleur de teinte explicite."""
+    if not sprite or sprite.full_surface is None:
+        return  # Aucun sprite, ou sprite à la demande dont le fichier n'a pas pu être décodé
     
     # Calculer la position relative à la caméra
     final_x = x
@@ -401,18 +1531,131 @@ def draw_sprite(x: float, y: float, name: str, image_index: int, xscale: float =
         final_x = x - cam['view_x']
         final_y = y - cam['view_y']
         
-        # Culling : ne pas dessiner si hors de la vue de la caméra
-        sprite_width = sprite.get_width() * abs(xscale)
-        sprite_height = sprite.get_height() * abs(yscale)
-        
-        if (final_x + sprite_width < 0 or final_x > cam['view_width'] or
-            final_y + sprite_height < 0 or final_y > cam['view_height']):
+        # Culling : ne pas dessiner si la boîte englobante est hors de la vue de la caméra
+        left, top, right, bottom = _get_sprite_bounds(sprite, final_x, final_y, xscale, yscale, angle, image_index)
+        if (right < 0 or left > cam['view_width'] or
+            bottom < 0 or top > cam['view_height']):
             return  # Hors de vue, ne pas dessiner
     
-    # Obtenir l'image à l'index spécifié
+    # Obtenir l'image transformée (depuis le cache si possible)
+    image = _get_transformed_image(sprite, image_index, xscale, yscale, angle, color)
+    
+    if angle != 0:
+        # L'image tournée est centrée sur la position de dessin
+        rect = image.get_rect(center=(final_x, final_y))
+        draw_x = rect.x
+        draw_y = rect.y
+    else:
+        # Pas de rotation, utiliser le calcul normal du centre
+        origin_x, origin_y = sprite.get_origin(image_index)
+        center_x = origin_x * abs(xscale)
+        center_y = origin_y * abs(yscale)
+        if xscale < 0:
+            center_x = image.get_width() - center_x
+        if yscale < 0:
+            center_y = image.get_height() - center_y
+        draw_x = final_x - center_x
+        draw_y = final_y - center_y
+    
+    # Dessiner l'image sur la surface appropriée (caméra ou écran)
+    _blit(image, (draw_x, draw_y))
+
+def _get_sprite_bounds(sprite: Sprite, x: float, y: float, xscale: float, yscale: float, angle: float,
+                       image_index: int = 0) -> Tuple[float, float, float, float]:
+    """
+    Calcule la boîte englobante de l'image dessinée par draw_sprite, en tenant
+    compte du centre du sprite, de l'échelle, du miroir et de la rotation.
+    
+    Returns:
+        Tuple (gauche, haut, droite, bas)
+    """
+    width = sprite.get_width() * abs(xscale)
+    height = sprite.get_height() * abs(yscale)
+    
+    if angle != 0:
+        # L'image tournée est centrée sur la position (1 pixel de marge pour les arrondis)
+        rad = math.radians(angle)
+        cos_a = abs(math.cos(rad))
+        sin_a = abs(math.sin(rad))
+        half_width = (width * cos_a + height * sin_a) / 2 + 1
+        half_height = (width * sin_a + height * cos_a) / 2 + 1
+        return (x - half_width, y - half_height, x + half_width, y + half_height)
+    
+    origin_x, origin_y = sprite.get_origin(image_index)
+    center_x = origin_x * abs(xscale)
+    center_y = origin_y * abs(yscale)
+    if xscale < 0:
+        center_x = width - center_x
+    if yscale < 0:
+        center_y = height - center_y
+    left = x - center_x
+    top = y - center_y
+    return (left, top, left + width, top + height)
+
+def _blit(image: pygame.Surface, position: Tuple[float, float]):
+    """
+    Dessine une image sur la surface cible courante.
+    En mode rendu par lots, l'image est mise en file d'attente à la place.
+    """
+    global _blit_queue_target
+    target_surface = _current_surface or _screen
+    if _dirty_rects_enabled:
+        _dirty_add(image, position[0], position[1], image.get_width(), image.get_height())
+    if _blit_batching:
+        if target_surface is not _blit_queue_target:
+            _flush_blit_queue()
+            _blit_queue_target = target_surface
+        _blit_queue.append((image, position))
+    else:
+        target_surface.blit(image, position)
+
+def _flush_blit_queue():
+    """Envoie les images en attente avec un seul appel à Surface.blits()."""
+    global _blit_queue_target
+    if _blit_queue:
+        _blit_queue_target.blits(_blit_queue, doreturn=False)
+        _blit_queue.clear()
+    _blit_queue_target = None
+
+def _begin_blit_batch():
+    """Active le mode rendu par lots."""
+    global _blit_batching
+    _blit_batching = True
+
+def _end_blit_batch():
+    """Envoie les images en attente et désactive le mode rendu par lots."""
+    global _blit_batching
+    _flush_blit_queue()
+    _blit_batching = False
+
+def _get_transformed_image(sprite: Sprite, image_index: int, xscale: float, yscale: float, angle: float, color) -> pygame.Surface:
+    """
+    Retourne l'image d'un sprite avec l'échelle, le miroir, la teinte
+    et la rotation appliqués, en passant par le cache.
+    """
     image = sprite.get_image(image_index)
-    original_center_x = sprite.center_x
-    original_center_y = sprite.center_y
+    
+    # Quantifier l'angle pour que des angles proches partagent la même image
+    if _transform_angle_step > 0:
+        angle = round(angle / _transform_angle_step) * _transform_angle_step
+    angle = angle % 360
+    
+    if color == (255, 255, 255):
+        color = None
+    
+    # Aucune transformation : l'image d'origine suffit
+    if xscale == 1.0 and yscale == 1.0 and angle == 0 and color is None:
+        return image
+    
+    key = (sprite, image_index, xscale, yscale, angle, tuple(color) if color else None)
+    cached = _transform_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # Les images sans alpha par pixel perdraient leur transparence en étant teintées
+    # ou tournées (coins remplis) : passer par une copie avec alpha
+    if not image.get_flags() & pygame.SRCALPHA and (image.get_colorkey() is not None or angle % 90):
+        image = image.convert_alpha()
     
     # Appliquer l'échelle
     if xscale != 1.0 or yscale != 1.0:
@@ -420,73 +1663,64 @@ def draw_sprite(x: float, y: float, name: str, image_index: int, xscale: float =
         new_height = int(image.get_height() * abs(yscale))
         image = pygame.transform.scale(image, (new_width, new_height))
         
-        # Ajuster le centre avec l'échelle
-        original_center_x *= abs(xscale)
-        original_center_y *= abs(yscale)
-        
         # Flip si échelle négative
-        if xscale < 0:
-            image = pygame.transform.flip(image, True, False)
-            original_center_x = image.get_width() - original_center_x
-        if yscale < 0:
-            image = pygame.transform.flip(image, False, True)
-            original_center_y = image.get_height() - original_center_y
+        if xscale < 0 or yscale < 0:
+            image = pygame.transform.flip(image, xscale < 0, yscale < 0)
     
     # Appliquer la couleur de dessin si elle n'est pas blanche
-    if _draw_color != (255, 255, 255):
+    if color is not None:
         # Créer une copie de l'image pour ne pas modifier l'original
         image = image.copy()
         # Créer une surface colorée avec la même taille
         color_surface = pygame.Surface(image.get_size(), pygame.SRCALPHA)
-        color_surface.fill(_draw_color)
+        color_surface.fill(color)
         # Appliquer la couleur en mode multiply
         image.blit(color_surface, (0, 0), special_flags=pygame.BLEND_MULT)
     
     # Appliquer la rotation si nécessaire
     if angle != 0:
-        # Sauvegarder les dimensions avant rotation
-        old_center = (original_center_x, original_center_y)
-        
-        # Appliquer la rotation
-        rotated_image = pygame.transform.rotate(image, angle)
-        
-        # Calculer le nouveau centre après rotation
-        old_rect = image.get_rect(center=(final_x, final_y))
-        new_rect = rotated_image.get_rect(center=old_rect.center)
-        
-        # La position de dessin est maintenant le coin supérieur gauche du nouveau rectangle
-        draw_x = new_rect.x
-        draw_y = new_rect.y
-        
-        image = rotated_image
-    else:
-        # Pas de rotation, utiliser le calcul normal du centre
-        draw_x = final_x - original_center_x
-        draw_y = final_y - original_center_y
+        image = pygame.transform.rotate(image, angle)
     
-    # Dessiner l'image sur la surface appropriée (caméra ou écran)
-    target_surface = _current_surface or _screen
-    target_surface.blit(image, (draw_x, draw_y))
+    _transform_cache.put(key, image)
+    return image
 
-def draw_text(x: float, y: float, text: str, scale: float = 1, font_name: Optional[str] = None):
-    """Dessine du texte en tenant compte de la caméra et de l'alignement."""
-    # Préparer la police
-    font = None
-    if font_name:
-        font = get_font(font_name)
+def sprite_cache_set_budget(max_bytes: int):
+    """
+    Définit la mémoire maximale utilisée par le cache des sprites transformés.
     
-    if font is None:
-        font = pygame.font.Font(None, int(24 * scale))
+    Args:
+        max_bytes: Budget en octets (0 pour désactiver le cache)
+    """
+    _transform_cache.set_max_bytes(max_bytes)
+
+def sprite_cache_set_angle_step(step: float):
+    """
+    Définit le pas de quantification des angles de rotation.
     
-    # Créer la surface de texte
-    color = _draw_color
-    text_surface = font.render(str(text), True, color)
+    Args:
+        step: Pas en degrés (0 pour utiliser les angles exacts)
+    """
+    global _transform_angle_step
+    _transform_angle_step = max(0.0, float(step))
+    _transform_cache.clear()
+
+def sprite_cache_clear():
+    """Vide le cache des sprites transformés."""
+    _transform_cache.clear()
+
+def sprite_cache_get_stats() -> Dict[str, Any]:
+    """
+    Retourne les statistiques du cache des sprites transformés.
     
-    # Appliquer le scaling
-    if scale != 1:
-        new_width = int(text_surface.get_width() * scale)
-        new_height = int(text_surface.get_height() * scale)
-        text_surface = pygame.transform.scale(text_surface, (new_width, new_height))
+    Returns:
+        Dictionnaire (entries, bytes, max_bytes, hits, misses, evictions, hit_rate)
+    """
+    return _transform_cache.get_stats()
+
+def draw_text(x: float, y: float, text: str, scale: float = 1, font_name: Optional[str] = None):
+    """Dessine du texte en tenant compte de la caméra et de l'alignement."""
+    # Créer la surface de texte (depuis le cache si possible)
+    text_surface = _render_text(str(text), scale, font_name, _draw_color)
     
     # Calculer les dimensions du texte
     text_width = text_surface.get_width()
@@ -515,8 +1749,59 @@ def draw_text(x: float, y: float, text: str, scale: float = 1, font_name: Option
         final_y = final_y - cam['view_y']
     
     # Dessiner le texte
-    target_surface = _current_surface or _screen
-    target_surface.blit(text_surface, (final_x, final_y))
+    _blit(text_surface, (final_x, final_y))
+
+def _get_text_font(font_name: Optional[str], scale: float) -> pygame.font.Font:
+    """
+    Retourne la police à utiliser pour le texte, à la taille entière la plus proche
+    de la taille de base multipliée par l'échelle (le texte n'est jamais étiré).
+    """
+    if font_name not in _font_families:
+        font_name = None  # Police par défaut
+    base_size = _font_families[font_name][1] if font_name else 24
+    return _get_font_size(font_name, max(1, round(base_size * scale)))
+
+def _render_text(text: str, scale: float, font_name: Optional[str], color, antialias: bool = True) -> pygame.Surface:
+    """Retourne la surface d'un texte rendu à l'échelle voulue, en passant par le cache."""
+    color = tuple(color)
+    # Clé sur la police résolue : une police rechargée sous le même nom ne sert pas d'anciens rendus
+    font = _get_text_font(font_name, scale)
+    key = (text, font, color, antialias)
+    text_surface = _text_cache.get(key)
+    if text_surface is not None:
+        return text_surface
+    
+    text_surface = font.render(text, antialias, color)
+    
+    _text_cache.put(key, text_surface)
+    return text_surface
+
+def text_cache_set_budget(max_bytes: int):
+    """
+    Définit la mémoire maximale utilisée par le cache des textes rendus.
+    
+    Args:
+        max_bytes: Budget en octets (0 pour désactiver le cache)
+    """
+    _text_cache.set_max_bytes(max_bytes)
+
+def text_cache_clear():
+    """Vide le cache des textes rendus et des tailles de polices créées à la demande."""
+    _text_cache.clear()
+    base_sizes = {(name, size) for name, (_, size) in _font_families.items()}
+    for key in [key for key in _font_cache if key not in base_sizes]:
+        del _font_cache[key]
+
+def text_cache_get_stats() -> Dict[str, Any]:
+    """
+    Retourne les statistiques du cache des textes rendus.
+    
+    Returns:
+        Dictionnaire (entries, bytes, max_bytes, hits, misses, evictions, hit_rate, fonts)
+    """
+    stats = _text_cache.get_stats()
+    stats['fonts'] = len(_font_cache)
+    return stats
 
 # Fonctions utilitaires pour calculer les dimensions du texte
 def string_width(text: str, scale: float = 1, font_name: Optional[str] = None) -> int:
@@ -531,20 +1816,7 @@ def string_width(text: str, scale: float = 1, font_name: Optional[str] = None) -
     Returns:
         Largeur du texte en pixels
     """
-    font = None
-    if font_name:
-        font = get_font(font_name)
-    
-    if font is None:
-        font = pygame.font.Font(None, int(24 * scale))
-    
-    text_surface = font.render(str(text), True, (255, 255, 255))
-    width = text_surface.get_width()
-    
-    if scale != 1:
-        width = int(width * scale)
-    
-    return width
+    return _get_text_font(font_name, scale).size(str(text))[0]
 
 def string_height(text: str, scale: float = 1, font_name: Optional[str] = None) -> int:
     """
@@ -558,20 +1830,7 @@ def string_height(text: str, scale: float = 1, font_name: Optional[str] = None)
     Returns:
         Hauteur du texte en pixels
     """
-    font = None
-    if font_name:
-        font = get_font(font_name)
-    
-    if font is None:
-        font = pygame.font.Font(None, int(24 * scale))
-    
-    text_surface = font.render(str(text), True, (255, 255, 255))
-    height = text_surface.get_height()
-    
-    if scale != 1:
-        height = int(height * scale)
-    
-    return height
+    return _get_text_font(font_name, scale).size(str(text))[1]
 
 # Gestion des surfaces
 def surface_create(width: int, height: int) -> pygame.Surface:
@@ -594,11 +1853,13 @@ def surface_set_target(surface: pygame.Surface):
         surface: Surface cible (None pour l'écran)
     """
     global _current_surface
+    _flush_blit_queue()
     _current_surface = surface
 
 def surface_reset_target():
     """Remet l'écran comme cible de rendu."""
     global _current_surface
+    _flush_blit_queue()
     _current_surface = None
 
 def surface_destroy(surface: pygame.Surface):
@@ -625,6 +1886,9 @@ def surface_draw(x: float, y: float, surface: pygame.Surface, xscale: float = 1,
     if not target or not surface:
         return
     
+    # La surface a pu être dessinée par des sprites encore en attente
+    _flush_blit_queue()
+    
     draw_surface = surface
     
     # Appliquer les transformations
@@ -649,6 +1913,115 @@ def surface_draw(x: float, y: float, surface: pygame.Surface, xscale: float = 1,
             draw_surface.set_alpha(_render_alpha)
     
     target.blit(draw_surface, (int(x), int(y)))
+    
+    if _dirty_rects_enabled:
+        # Le contenu d'une surface peut changer sans que l'objet change : toujours réafficher
+        _dirty_add(object(), int(x), int(y), draw_surface.get_width(), draw_surface.get_height())
+
+# Présentation à l'écran
+def display_set_dirty_rects(enabled: bool, threshold: float = 0.5):
+    """
+    Active la présentation par rectangles modifiés à la place de pygame.display.flip().
+    Seules les zones où le dessin a changé depuis la frame précédente sont envoyées
+    à l'écran avec pygame.display.update(rects).
+    
+    Args:
+        enabled: True pour activer le mode
+        threshold: Fraction de l'écran (0.0 à 1.0) au-delà de laquelle tout l'écran est réaffiché
+    """
+    global _dirty_rects_enabled, _dirty_rects_threshold
+    _dirty_rects_enabled = enabled
+    _dirty_rects_threshold = threshold
+    _dirty_current.clear()
+    _dirty_previous.clear()
+    _dirty_clear_colors.clear()
+    _dirty_camera_states.clear()
+    display_invalidate()
+
+def display_invalidate():
+    """Force le réaffichage complet de l'écran à la prochaine frame."""
+    global _dirty_full
+    _dirty_full = True
+
+def _dirty_add(source, x: float, y: float, width: int, height: int):
+    """
+    Enregistre une zone dessinée sur la cible courante, en coordonnées écran.
+    La source identifie le dessin pour le comparer à la frame précédente.
+    """
+    if _current_surface is None:
+        rect = pygame.Rect(int(x) - 1, int(y) - 1, width + 2, height + 2)
+    elif _active_camera is not None and _camera_surfaces.get(_active_camera) is _current_surface:
+        # Convertir de la surface de caméra vers le viewport à l'écran
+        cam = _cameras[_active_camera]
+        scale_x = cam['port_width'] / cam['view_width']
+        scale_y = cam['port_height'] / cam['view_height']
+        left = math.floor(cam['port_x'] + x * scale_x) - 1
+        top = math.floor(cam['port_y'] + y * scale_y) - 1
+        right = math.ceil(cam['port_x'] + (x + width) * scale_x) + 1
+        bottom = math.ceil(cam['port_y'] + (y + height) * scale_y) + 1
+        rect = pygame.Rect(left, top, right - left, bottom - top)
+    else:
+        return  # Surface personnalisée : prise en compte lors de son surface_draw()
+    _dirty_current[(source, rect.x, rect.y, rect.width, rect.height)] = rect
+
+def _dirty_check_camera(camera_id: int, cam: Dict[str, Any]):
+    """Force un réaffichage complet si la vue ou le viewport de la caméra a changé."""
+    state = (cam['view_x'], cam['view_y'], cam['view_width'], cam['view_height'],
+             cam['port_x'], cam['port_y'], cam['port_width'], cam['port_height'])
+    if _dirty_camera_states.get(camera_id) != state:
+        _dirty_camera_states[camera_id] = state
+        display_invalidate()
+
+def _dirty_changed_rects() -> List[pygame.Rect]:
+    """Retourne les zones dessinées cette frame ou la précédente, mais pas les deux."""
+    changed = [rect for key, rect in _dirty_current.items() if key not in _dirty_previous]
+    changed.extend(rect for key, rect in _dirty_previous.items() if key not in _dirty_current)
+    return changed
+
+def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Fusionne les rectangles qui se chevauchent."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+def _present_display():
+    """Affiche la frame : flip() complet ou mise à jour des seules zones modifiées."""
+    global _dirty_full, _dirty_current, _dirty_previous
+    if not _dirty_rects_enabled or not _screen:
+        pygame.display.flip()
+        return
+    
+    full = _dirty_full
+    rects: List[pygame.Rect] = []
+    if not full:
+        rects = _dirty_changed_rects()
+        if len(rects) > 256:
+            full = True  # Trop de zones : la fusion coûterait plus qu'un flip()
+        else:
+            screen_rect = _screen.get_rect()
+            rects = [rect.clip(screen_rect) for rect in _merge_rects(rects)]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area > _dirty_rects_threshold * screen_rect.width * screen_rect.height:
+                full = True
+    
+    if full:
+        pygame.display.flip()
+    elif rects:
+        pygame.display.update(rects)
+    
+    # La frame courante devient la référence pour la suivante
+    _dirty_previous, _dirty_current = _dirty_current, _dirty_previous
+    _dirty_current.clear()
+    _dirty_full = False
 
 # Gestion de la fenêtre
 def window_get_size() -> Tuple[int, int]:
@@ -671,10 +2044,12 @@ def window_set_size(width: int, height: int):
     """
     global _screen
     if _game_instance:
+        _flush_blit_queue()
         _screen = pygame.display.set_mode((width, height))
         _game_instance.screen = _screen
         _game_instance.width = width
         _game_instance.height = height
+        display_invalidate()
 
 # Gestion de la caméra
 def camera_create() -> int:
@@ -696,14 +2071,40 @@ def camera_create() -> int:
         'port_x': 0,
         'port_y': 0,
         'port_width': 800,
-        'port_height': 600
+        'port_height': 600,
+        'transparent': False,
+        'enabled': False
     }
     
     # Créer la surface de rendu pour cette caméra
-    _camera_surfaces[camera_id] = pygame.Surface((800, 600), pygame.SRCALPHA)
+    _camera_surfaces[camera_id] = _create_camera_surface(800, 600, False)
     
     return camera_id
 
+def _create_camera_surface(width: int, height: int, transparent: bool) -> pygame.Surface:
+    """Crée la surface de rendu d'une caméra, au format de l'écran si elle est opaque."""
+    if transparent:
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+    surface = pygame.Surface((width, height))
+    if pygame.display.get_surface():
+        surface = surface.convert()
+    return surface
+
+def camera_set_transparent(camera_id: int, transparent: bool):
+    """
+    Définit si la surface de la caméra garde la transparence (ex: mini-carte
+    superposée au jeu). Une caméra opaque est plus rapide à effacer et à afficher.
+    
+    Args:
+        camera_id: ID de la caméra
+        transparent: True pour une surface avec canal alpha
+    """
+    if camera_id in _cameras and _cameras[camera_id]['transparent'] != transparent:
+        cam = _cameras[camera_id]
+        cam['transparent'] = transparent
+        _camera_surfaces[camera_id] = _create_camera_surface(cam['view_width'], cam['view_height'], transparent)
+        _camera_port_surfaces.pop(camera_id, None)
+
 def camera_set_view_size(camera_id: int, width: int, height: int):
     """
     Définit la taille de la vue de la caméra et recrée sa surface.
@@ -716,7 +2117,7 @@ def camera_set_view_size(camera_id: int, width: int, height: int):
         _cameras[camera_id]['view_width'] = width
         _cameras[camera_id]['view_height'] = height
         # Recréer la surface avec la nouvelle taille
-        _camera_surfaces[camera_id] = pygame.Surface((width, height), pygame.SRCALPHA)
+        _camera_surfaces[camera_id] = _create_camera_surface(width, height, _cameras[camera_id]['transparent'])
 
 def camera_set_view_port(camera_id: int, x: int, y: int, width: int, height: int):
     """
@@ -745,6 +2146,24 @@ def camera_set_active(camera_id: int):
     if camera_id in _cameras:
         _active_camera = camera_id
 
+def camera_set_enabled(camera_id: int, enabled: bool):
+    """
+    Active ou désactive le rendu d'une caméra par la scène.
+    Dès qu'au moins une caméra est activée, Scene.draw() rend la scène dans
+    toutes les caméras activées (dans l'ordre de création) au lieu de la
+    seule caméra active : écran partagé, mini-carte...
+    
+    Args:
+        camera_id: ID de la caméra
+        enabled: True pour rendre cette caméra à chaque frame
+    """
+    if camera_id in _cameras:
+        _cameras[camera_id]['enabled'] = enabled
+
+def _get_enabled_cameras() -> List[int]:
+    """Retourne les IDs des caméras activées, dans l'ordre de création."""
+    return [camera_id for camera_id, cam in _cameras.items() if cam['enabled']]
+
 def camera_set_view_pos(camera_id: int, x: float, y: float):
     """
     Définit la position de la vue de la caméra.
@@ -985,18 +2404,216 @@ def mouse_get_screen_y() -> int:
     return _mouse_y
 
 # Fonctions utilitaires supplémentaires
-def play_sound(sound_name: str, volume: float = 1.0):
+# Groupes de sons : nom -> {'limit': voix simultanées max (None = illimité), 'volume': volume du groupe}
+_sound_groups: Dict[str, Dict[str, Any]] = {}
+# Voix en cours : index de canal -> (groupe, priorité, numéro d'ordre de lancement)
+_voices: Dict[int, Tuple[Optional[str], int, int]] = {}
+_channels: List[pygame.mixer.Channel] = []
+_voice_counter = 0
+_sounds_last_frame: Dict[str, int] = {}  # nom -> dernière frame où le son a été joué
+_sound_stats = {'played': 0, 'stolen': 0, 'dropped': 0, 'merged': 0}
+
+def sound_set_channels(count: int):
     """
-    Joue un son.
+    Définit le nombre de canaux du mixeur (8 par défaut), c'est-à-dire de sons simultanés.
+    
+    Args:
+        count: Nombre de canaux
+    """
+    if pygame.mixer.get_init():
+        pygame.mixer.set_num_channels(count)
+        # Les index de canaux changent : oublier toutes les voix suivies
+        _channels.clear()
+        _voices.clear()
+
+def sound_group_set(group: str, limit: Optional[int] = None, volume: float = 1.0):
+    """
+    Configure un groupe de sons (ex: "steps", "ui", "explosions").
+    
+    Args:
+        group: Nom du groupe
+        limit: Nombre maximal de sons du groupe joués en même temps (None pour aucune limite)
+        volume: Volume appliqué à tous les sons du groupe (0.0 à 1.0)
+    """
+    _sound_groups[group] = {'limit': limit, 'volume': volume}
+
+def play_sound(sound_name: str, volume: float = 1.0, group: Optional[str] = None,
+               priority: int = 0, loops: int = 0) -> Optional[pygame.mixer.Channel]:
+    """
+    Joue un son sur un canal libre.
+    Si aucun canal n'est libre (ou si le groupe a atteint sa limite), le son le plus ancien
+    de priorité inférieure ou égale est interrompu ; sinon le nouveau son est ignoré.
+    Dans la boucle de jeu, un même son demandé plusieurs fois dans une frame n'est joué qu'une fois.
     
     Args:
         sound_name: Nom du son
         volume: Volume (0.0 à 1.0)
+        group: Groupe du son (voir sound_group_set)
+        priority: Priorité (les sons de priorité plus haute ne sont pas interrompus)
+        loops: Nombre de répétitions supplémentaires (-1 pour boucler)
+    
+    Returns:
+        Le canal utilisé, ou None si le son n'a pas été joué
     """
+    global _voice_counter
     sound = get_sound(sound_name)
-    if sound:
-        sound.set_volume(volume)
-        sound.play()
+    if not sound or not pygame.mixer.get_init():
+        return None
+    
+    if _frame_count and _sounds_last_frame.get(sound_name) == _frame_count:
+        _sound_stats['merged'] += 1
+        return None
+    
+    channels = _get_channels()
+    for index in [index for index in _voices if index >= len(channels) or not channels[index].get_busy()]:
+        del _voices[index]
+    
+    # Limite du groupe : remplacer le son le plus ancien du groupe
+    settings = _sound_groups.get(group) if group else None
+    index = None
+    if settings and settings['limit'] is not None:
+        group_voices = [i for i, voice in _voices.items() if voice[0] == group]
+        if len(group_voices) >= settings['limit']:
+            index = _steal_voice(group_voices, priority)
+            if index is None:
+                _sound_stats['dropped'] += 1
+                return None
+    
+    # Canal libre, sinon remplacer le son le moins prioritaire
+    if index is None:
+        index = next((i for i, channel in enumerate(channels) if i not in _voices and not channel.get_busy()), None)
+    if index is None:
+        index = _steal_voice(list(_voices), priority)
+        if index is None:
+            _sound_stats['dropped'] += 1
+            return None
+    
+    # Le volume est celui du canal : le Sound partagé n'est pas modifié
+    channel = channels[index]
+    channel.play(sound, loops)
+    channel.set_volume(volume * (settings['volume'] if settings else 1.0))
+    _voice_counter += 1
+    _voices[index] = (group, priority, _voice_counter)
+    _sounds_last_frame[sound_name] = _frame_count
+    _sound_stats['played'] += 1
+    return channel
+
+def _get_channels() -> List[pygame.mixer.Channel]:
+    """Retourne les canaux du mixeur (créés une seule fois)."""
+    if len(_channels) != pygame.mixer.get_num_channels():
+        _channels[:] = [pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())]
+    return _channels
+
+def _steal_voice(candidates: List[int], priority: int) -> Optional[int]:
+    """Interrompt la voix la moins prioritaire (puis la plus ancienne) parmi les candidates."""
+    candidates = [i for i in candidates if _voices[i][1] <= priority]
+    if not candidates:
+        return None
+    index = min(candidates, key=lambda i: (_voices[i][1], _voices[i][2]))
+    _channels[index].stop()
+    del _voices[index]
+    _sound_stats['stolen'] += 1
+    return index
+
+def sound_get_stats() -> Dict[str, Any]:
+    """
+    Retourne les statistiques de lecture des sons.
+    
+    Returns:
+        Dictionnaire (played, stolen, dropped, merged, voices, channels)
+    """
+    stats = dict(_sound_stats)
+    if pygame.mixer.get_init():
+        channels = _get_channels()
+        stats['voices'] = sum(1 for i in _voices if i < len(channels) and channels[i].get_busy())
+        stats['channels'] = len(channels)
+    else:
+        stats['voices'] = 0
+        stats['channels'] = 0
+    return stats
+
+def load_music(filepath: str, name: Optional[str] = None) -> bool:
+    """
+    Enregistre une musique. Le fichier n'est pas décodé : il est lu en streaming
+    par music_play(), la mémoire utilisée ne dépend donc pas de sa durée.
+    
+    Args:
+        filepath: Chemin vers le fichier audio
+        name: Nom de la musique (optionnel, utilise le nom du fichier par défaut)
+    
+    Returns:
+        True si le fichier existe
+    """
+    if not os.path.exists(filepath):
+        print(f"Erreur lors du chargement de la musique '{filepath}': fichier introuvable")
+        return False
+    if name is None:
+        name = os.path.splitext(os.path.basename(filepath))[0]
+    _music[name] = filepath
+    print(f"Musique '{name}' enregistrée")
+    return True
+
+def music_play(name: str, loops: int = -1, volume: float = 1.0, fade_ms: int = 0) -> bool:
+    """
+    Joue une musique en streaming (remplace la musique en cours).
+    
+    Args:
+        name: Nom de la musique
+        loops: Nombre de répétitions supplémentaires (-1 pour boucler)
+        volume: Volume (0.0 à 1.0)
+        fade_ms: Durée du fondu d'entrée en millisecondes
+    
+    Returns:
+        True si la lecture a commencé
+    """
+    filepath = _music.get(name)
+    if filepath is None or not pygame.mixer.get_init():
+        return False
+    try:
+        pygame.mixer.music.load(filepath)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        return True
+    except pygame.error as e:
+        print(f"Erreur lors de la lecture de la musique '{name}': {e}")
+        return False
+
+def music_stop(fade_ms: int = 0):
+    """
+    Arrête la musique.
+    
+    Args:
+        fade_ms: Durée du fondu de sortie en millisecondes (0 pour arrêter immédiatement)
+    """
+    if pygame.mixer.get_init():
+        if fade_ms > 0:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+def music_pause():
+    """Met la musique en pause."""
+    if pygame.mixer.get_init():
+        pygame.mixer.music.pause()
+
+def music_resume():
+    """Reprend la musique mise en pause."""
+    if pygame.mixer.get_init():
+        pygame.mixer.music.unpause()
+
+def music_set_volume(volume: float):
+    """
+    Change le volume de la musique.
+    
+    Args:
+        volume: Volume (0.0 à 1.0)
+    """
+    if pygame.mixer.get_init():
+        pygame.mixer.music.set_volume(volume)
+
+def music_is_playing() -> bool:
+    """Retourne True si une musique est en cours de lecture."""
+    return bool(pygame.mixer.get_init()) and pygame.mixer.music.get_busy()
 
 def stop_sound(sound_name: str):
     """
@@ -1027,6 +2644,7 @@ def draw_rectangle(x: float, y: float, width: float, height: float, filled: bool
         final_x = x - cam['view_x']
         final_y = y - cam['view_y']
     
+    _flush_blit_queue()
     surface = _current_surface or _screen
     if not surface:
         return
@@ -1034,9 +2652,12 @@ def draw_rectangle(x: float, y: float, width: float, height: float, filled: bool
     rect = pygame.Rect(int(final_x), int(final_y), int(width), int(height))
     
     if filled:
-        pygame.draw.rect(surface, _render_color, rect)
+        drawn = pygame.draw.rect(surface, _render_color, rect)
     else:
-        pygame.draw.rect(surface, _render_color, rect, 1)
+        drawn = pygame.draw.rect(surface, _render_color, rect, 1)
+    
+    if _dirty_rects_enabled:
+        _dirty_add(('rectangle', _render_color, filled), drawn.x, drawn.y, drawn.width, drawn.height)
 
 def draw_circle(x: float, y: float, radius: float, filled: bool = True):
     """
@@ -1056,14 +2677,18 @@ def draw_circle(x: float, y: float, radius: float, filled: bool = True):
         final_x = x - cam['view_x']
         final_y = y - cam['view_y']
     
+    _flush_blit_queue()
     surface = _current_surface or _screen
     if not surface:
         return
     
     if filled:
-        pygame.draw.circle(surface, _render_color, (int(final_x), int(final_y)), int(radius))
+        drawn = pygame.draw.circle(surface, _render_color, (int(final_x), int(final_y)), int(radius))
     else:
-        pygame.draw.circle(surface, _render_color, (int(final_x), int(final_y)), int(radius), 1)
+        drawn = pygame.draw.circle(surface, _render_color, (int(final_x), int(final_y)), int(radius), 1)
+    
+    if _dirty_rects_enabled:
+        _dirty_add(('circle', _render_color, filled), drawn.x, drawn.y, drawn.width, drawn.height)
 
 def draw_line(x1: float, y1: float, x2: float, y2: float, width: int = 1):
     """
@@ -1087,11 +2712,16 @@ def draw_line(x1: float, y1: float, x2: float, y2: float, width: int = 1):
         final_x2 = x2 - cam['view_x']
         final_y2 = y2 - cam['view_y']
     
+    _flush_blit_queue()
     surface = _current_surface or _screen
     if not surface:
         return
     
-    pygame.draw.line(surface, _render_color, (int(final_x1), int(final_y1)), (int(final_x2), int(final_y2)), width)
+    drawn = pygame.draw.line(surface, _render_color, (int(final_x1), int(final_y1)), (int(final_x2), int(final_y2)), width)
+    
+    if _dirty_rects_enabled:
+        _dirty_add(('line', _render_color, width, final_x1, final_y1, final_x2, final_y2),
+                   drawn.x, drawn.y, drawn.width, drawn.height)
 
 def random_range(min_val: float, max_val: float) -> float:
     """
@@ -1263,6 +2893,7 @@ def _clear_input_states():
 def _end_frame_cleanup():
     """Nettoyage de fin de frame."""
     _clear_input_states()
+    _apply_asset_reloads()
 
 def go_to(scene):
     """Change la scène."""
@@ -1278,7 +2909,10 @@ def entity_number(entity_type):
     return _game_instance.current_scene.count_entities_of_type(entity_type)
 
 def get_entities(entity_type):
-    """Retourne la liste d'entité d'un type."""
+    """
+    Retourne les entités d'un type, en séquence en lecture seule tenue à jour par la scène
+    (comparable à une liste ; utiliser list() pour en garder une copie).
+    """
     return _game_instance.current_scene.get_entities_of_type(entity_type)
 
 def get_delta_time():
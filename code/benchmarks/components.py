@@ -0,0 +1,65 @@
+"""
+Mesure le temps de Scene.step pour des projectiles en mouvement.
+
+Compare Entity (mouvement dans step(), entité par entité) avec ArrayEntity
+(mouvement calculé en une passe vectorisée par les tableaux NumPy de la scène).
+Lancer depuis le dossier code/ : python benchmarks/components.py [nombre d'entités]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ViviEngine import ArrayEntity, Entity, Scene
+
+STEPS = 20
+
+class Projectile(Entity):
+    """Projectile classique : se déplace dans step()."""
+    __slots__ = ('hspeed', 'vspeed')
+
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(x, y)
+        self.hspeed = 4.0
+        self.vspeed = 1.0
+
+    def step(self):
+        super().step()
+        self.x += self.hspeed
+        self.y += self.vspeed
+
+class ArrayProjectile(ArrayEntity):
+    """Projectile stocké dans les tableaux de la scène."""
+    __slots__ = ()
+
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(x, y)
+        self.hspeed = 4.0
+        self.vspeed = 1.0
+
+def measure_step(entity_class, count: int) -> float:
+    """Retourne la durée moyenne d'un Scene.step en millisecondes."""
+    scene = Scene()
+    for i in range(count):
+        projectile = entity_class(i % 800, i // 800)
+        projectile.image_number = 4
+        projectile.image_speed = 0.25
+        scene.add_entity(projectile)
+    scene.step()  # Ajout des entités
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        scene.step()
+    return (time.perf_counter() - start) * 1000 / STEPS
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"{count} projectiles")
+    print(f"{'classe':>16} {'ms/step':>10}")
+    for entity_class in (Projectile, ArrayProjectile):
+        print(f"{entity_class.__name__:>16} {measure_step(entity_class, count):>10.2f}")
+
+if __name__ == "__main__":
+    main()
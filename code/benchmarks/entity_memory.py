@@ -0,0 +1,110 @@
+"""
+Mesure la mémoire occupée par entité et le débit de Scene.step.
+
+Compare Entity avec la disposition d'avant __slots__ (mêmes méthodes, attributs dans un
+__dict__, masque en quatre attributs), une sous-classe sans __slots__ (attributs libres,
+avec __dict__) et une sous-classe qui déclare ses propres __slots__.
+Chaque mesure de débit commence par quelques frames d'échauffement ; les séries chronométrées
+(précédées d'un ramasse-miettes complet) alternent entre les classes et la meilleure est gardée,
+pour limiter l'effet du bruit de la machine.
+Lancer depuis le dossier code/ : python benchmarks/entity_memory.py [nombre d'entités]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ViviEngine import Entity, Scene
+
+STEPS = 10
+WARMUP_STEPS = 3
+REPEATS = 5
+
+# Disposition d'Entity avant __slots__ : mêmes méthodes, mais attributs dans le __dict__
+# de chaque instance et masque de collision en quatre attributs
+_MASK_ATTRIBUTES = ('mask_left', 'mask_right', 'mask_top', 'mask_bottom')
+_LegacyBase = type('_LegacyBase', (), {
+    name: value for name, value in vars(Entity).items()
+    if name not in Entity.__slots__ and name not in _MASK_ATTRIBUTES + ('__slots__', '__qualname__')
+})
+
+class LegacyEntity(_LegacyBase):
+    """Entity telle qu'avant __slots__ (utilisable dans une Scene pour mesurer step)."""
+
+    @property
+    def _mask(self):
+        return (self.mask_left, self.mask_right, self.mask_top, self.mask_bottom)
+
+    @_mask.setter
+    def _mask(self, value):
+        self.mask_left, self.mask_right, self.mask_top, self.mask_bottom = value
+
+class DictEntity(Entity):
+    """Sous-classe ordinaire : ses nouveaux attributs vont dans un __dict__."""
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(x, y)
+        self.speed = 1.0
+
+class SlottedEntity(Entity):
+    """Sous-classe compacte : ses nouveaux attributs sont aussi déclarés dans __slots__."""
+    __slots__ = ('speed',)
+
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(x, y)
+        self.speed = 1.0
+
+def measure_memory(entity_class, count: int) -> float:
+    """Retourne le nombre d'octets alloués par entité créée."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [entity_class(i, i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    # Retirer la liste elle-même (un pointeur par entité)
+    return (after - before) / count - 8
+
+def build_scene(entity_class, count: int) -> Scene:
+    """Crée une scène de count entités, ajoutées et échauffées."""
+    scene = Scene()
+    for i in range(count):
+        scene.add_entity(entity_class(i, i))
+    scene.step()  # Ajout des entités
+    for _ in range(WARMUP_STEPS):
+        scene.step()
+    return scene
+
+def time_steps(scene: Scene) -> float:
+    """Retourne la durée de STEPS appels à Scene.step."""
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        scene.step()
+    return time.perf_counter() - start
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    classes = (LegacyEntity, Entity, DictEntity, SlottedEntity)
+    memory = {entity_class: measure_memory(entity_class, count) for entity_class in classes}
+
+    # Séries alternées entre les classes : une dérive de la machine les touche toutes
+    scenes = {entity_class: build_scene(entity_class, count) for entity_class in classes}
+    best = {entity_class: float('inf') for entity_class in classes}
+    for _ in range(REPEATS):
+        for entity_class in classes:
+            best[entity_class] = min(best[entity_class], time_steps(scenes[entity_class]))
+
+    print(f"{count} entités")
+    print(f"{'classe':>14} {'octets/entité':>14} {'entités/s (step)':>17}")
+    for entity_class in classes:
+        throughput = count * STEPS / best[entity_class]
+        print(f"{entity_class.__name__:>14} {memory[entity_class]:>14.0f} {throughput:>17,.0f}")
+
+if __name__ == "__main__":
+    main()
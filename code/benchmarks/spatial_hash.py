@@ -0,0 +1,71 @@
+"""
+Compare bbox_collision avec et sans grille de collision (Scene.set_spatial_hash).
+
+Chaque entité se déplace puis teste une collision contre les murs, comme un jeu de plateforme.
+Lancer depuis le dossier code/ : python benchmarks/spatial_hash.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ViviEngine import Entity, Scene
+
+WORLD_SIZE = 4000
+FRAMES = 20
+
+class Wall(Entity):
+    def create(self):
+        self.mask_right = 31
+        self.mask_bottom = 31
+
+class Mover(Entity):
+    def create(self):
+        self.mask_right = 15
+        self.mask_bottom = 15
+        self.hspeed = random.uniform(-3, 3)
+
+    def step(self):
+        super().step()
+        if self.bbox_collision(self.x + self.hspeed, self.y, Wall):
+            self.hspeed = -self.hspeed
+        else:
+            self.x += self.hspeed
+
+def build_scene(count: int, cell_size):
+    """Crée une scène avec autant de murs que d'entités mobiles."""
+    random.seed(count)
+    scene = Scene()
+    for _ in range(count):
+        scene.add_entity(Wall(random.uniform(0, WORLD_SIZE), random.uniform(0, WORLD_SIZE)))
+        scene.add_entity(Mover(random.uniform(0, WORLD_SIZE), random.uniform(0, WORLD_SIZE)))
+    scene.set_spatial_hash(cell_size)
+    scene.step()  # Ajout des entités
+    return scene
+
+def measure(count: int, cell_size) -> float:
+    """Retourne la durée moyenne d'une frame (step de la scène) en millisecondes."""
+    scene = build_scene(count, cell_size)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        scene.step()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+def main():
+    print(f"{'entités':>8} {'sans grille':>12} {'avec grille':>12} {'gain':>6}")
+    crossover = None
+    for count in (10, 25, 50, 100, 200, 400, 800, 1600):
+        brute = measure(count, None)
+        hashed = measure(count, 64)
+        if crossover is None and hashed < brute:
+            crossover = count * 2
+        print(f"{count * 2:>8} {brute:>10.2f}ms {hashed:>10.2f}ms {brute / hashed:>5.1f}x")
+    if crossover:
+        print(f"La grille devient plus rapide à partir d'environ {crossover} entités")
+
+if __name__ == "__main__":
+    main()
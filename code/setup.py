@@ -7,6 +7,9 @@ setup(
     install_requires=[
         "pygame>=2.5.0",
     ],
+    extras_require={
+        "numpy": ["numpy"],  # ArrayEntity
+    },
     python_requires=">=3.12",
     author="LeDarron",
     author_email="",
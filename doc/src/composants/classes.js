@@ -129,7 +129,7 @@ const classes = [
           },
           {
             name: 'get_entities_of_type(entity_type)',
-            description: 'Return a list of all entities of the specified type/class'
+            description: 'Return a read-only live sequence of all entities of the specified type/class (compares equal to a list; use list() to keep a snapshot)'
           },
           {
             name: 'count_entities_of_type(entity_type)',
@@ -320,7 +320,7 @@ const functions = [
     name: 'get_entities',
     category: 'Entity Management',
     prototype: 'get_entities(entity_type)',
-    description: 'Get a list of all entities of the specified type in current scene'
+    description: 'Get a read-only live sequence of all entities of the specified type in current scene (compares equal to a list; use list() to keep a snapshot)'
   },
 
   // Scene Management